@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Concurrent-request latency benchmark for the database layer.
+
+Compares the old pattern (``async def`` handler calling a synchronous
+SQLAlchemy session) with the async session used by the API routes. Both
+variants are minimal apps whose handler runs the same query and returns
+only the row count, so they differ in the session alone: the response
+cache, ETags and JSON encoding of the real routes do not enter the
+comparison. Each serves the same sequence of ``skip`` offsets to a burst of
+concurrent clients while a ticker task measures how long the event loop is
+blocked. With aiosqlite only the SQLite calls leave the event loop; turning
+rows into ORM objects still runs on it.
+
+``--concurrency`` stays below the sync pool size (5 + 10 overflow) because
+the old pattern holds a pooled connection across the response and blocks
+the loop while waiting for a free one, which deadlocks until the pool
+timeout once every connection is checked out.
+
+Runs against a throwaway copy of ``uyd.db`` padded with extra rows, so the
+tracked database is never touched:
+
+    python benchmarks/bench_concurrency.py --requests 200 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+
+def prepare_database(workdir: Path, rows: int) -> None:
+    """Copy the project database into ``workdir`` and pad it with programs."""
+    import sqlite3
+
+    db_path = workdir / "uyd.db"
+    shutil.copy(PROJECT_DIR / "uyd.db", db_path)
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO programs (title, description, category, content, "
+        "created_at, updated_at, is_featured, is_active) "
+        "VALUES (?, ?, ?, ?, datetime('now'), datetime('now'), 0, 1)",
+        [
+            (f"Benchmark program {i}", "Benchmark row", "Leadership", "x" * 2000)
+            for i in range(rows)
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+
+def programs_query(skip: int, limit: int):
+    from sqlalchemy import select, true
+
+    from src.app.database.tables import Program
+
+    return (
+        select(Program)
+        .where(Program.is_active == true())
+        .order_by(Program.id)
+        .offset(skip)
+        .limit(limit)
+    )
+
+
+def build_sync_app():
+    """The pre-async handler shape: a blocking session in an ``async def``."""
+    from fastapi import Depends, FastAPI
+    from sqlalchemy.orm import Session
+
+    from src.app.database.config import get_db
+
+    app = FastAPI()
+    db_dependency = Depends(get_db)
+
+    @app.get("/api/programs")
+    async def get_programs(
+        skip: int = 0, limit: int = 100, db: Session = db_dependency
+    ):
+        rows = db.execute(programs_query(skip, limit)).scalars().all()
+        return {"count": len(rows)}
+
+    return app
+
+
+def build_async_app():
+    """The same handler on the async session the API routes use."""
+    from fastapi import Depends, FastAPI
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from src.app.database.config import get_async_db
+
+    app = FastAPI()
+    db_dependency = Depends(get_async_db)
+
+    @app.get("/api/programs")
+    async def get_programs(
+        skip: int = 0, limit: int = 100, db: AsyncSession = db_dependency
+    ):
+        rows = (await db.execute(programs_query(skip, limit))).scalars().all()
+        return {"count": len(rows)}
+
+    return app
+
+
+async def run_burst(app, requests: int, concurrency: int, path: str) -> dict:
+    """Fire ``requests`` concurrent GETs and record latency and loop lag."""
+    import httpx
+
+    lags = []
+    stop = asyncio.Event()
+
+    async def ticker():
+        interval = 0.001
+        while not stop.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - started - interval)
+
+    latencies = []
+    slots = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def one(i: int, record: bool = True):
+            async with slots:
+                started = time.perf_counter()
+                response = await client.get(path, params={"skip": (i * 7) % 1000})
+                response.raise_for_status()
+                if record:
+                    latencies.append(time.perf_counter() - started)
+
+        # Fill the connection pool before measuring
+        await asyncio.gather(*(one(i, record=False) for i in range(concurrency)))
+
+        tick = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await tick
+
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "max_loop_block_ms": max(lags, default=0.0) * 1000,
+        "req_per_s": requests / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="uyd-bench-"))
+    try:
+        prepare_database(workdir, args.rows)
+        os.chdir(workdir)
+        sys.path.insert(0, str(PROJECT_DIR))
+
+        from src.app.database.config import dispose_engines
+        from src.app.database.migrate import init_db
+
+        # Bring the copy to the current schema (this also creates the engines)
+        init_db()
+
+        async def run_variant(app) -> dict:
+            # Each variant starts from empty pools and closes them when done
+            try:
+                return await run_burst(
+                    app, args.requests, args.concurrency, "/api/programs"
+                )
+            finally:
+                await dispose_engines()
+
+        results = {
+            "sync session (before)": asyncio.run(run_variant(build_sync_app())),
+            "async session (after)": asyncio.run(run_variant(build_async_app())),
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(
+        f"{args.requests} GET /api/programs, {args.concurrency} in flight, "
+        f"{args.rows} extra rows"
+    )
+    print(
+        f"{'variant':<24}{'p50 ms':>10}{'p95 ms':>10}{'loop block ms':>16}{'req/s':>10}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name:<24}{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}"
+            f"{r['max_loop_block_ms']:>16.1f}{r['req_per_s']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Registrations per second with and without group commit.
+
+Sends ``--registrations`` signups to ``POST /api/events/register`` with
+``--concurrency`` in flight, once with every request committing its own
+transaction (``UYD_REGISTRATION_GROUP_COMMIT=0``) and once through the
+batching registration writer. Each mode runs in its own subprocess against
+a throwaway copy of ``uyd.db``, so the tracked database is not touched:
+
+    python benchmarks/bench_registrations.py --registrations 2000 --concurrency 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+MODES = {
+    "commit-per-request": "0",
+    "group-commit": "1",
+}
+
+
+def create_event(db_path: Path) -> int:
+    """An open event without a participant limit, so every signup is written."""
+    conn = sqlite3.connect(db_path)
+    start = datetime.now() + timedelta(days=7)
+    event_id = conn.execute(
+        "INSERT INTO events (title, description, event_type, start_date, "
+        "end_date, location, registration_deadline, created_at, updated_at, "
+        "is_featured, is_active, registered_count) "
+        "VALUES ('Bench', 'Bench', 'Leadership', ?, ?, 'Online', ?, "
+        "datetime('now'), datetime('now'), 0, 1, 0)",
+        (start, start + timedelta(hours=2), start),
+    ).lastrowid
+    conn.commit()
+    conn.close()
+    return event_id
+
+
+async def run_burst(app, event_id: int, registrations: int, concurrency: int) -> dict:
+    import httpx
+    from sqlalchemy.exc import OperationalError
+
+    latencies = []
+    statuses = Counter()
+    slots = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=None
+    ) as client:
+
+        async def one(i: int):
+            async with slots:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(
+                        "/api/events/register",
+                        json={
+                            "event_id": event_id,
+                            "user_name": f"Bench User {i}",
+                            "user_email": f"bench{i}@example.com",
+                            "user_mobile_number": f"0712{i:06d}",
+                        },
+                    )
+                    statuses[response.status_code] += 1
+                except OperationalError as err:  # "database is locked"
+                    statuses[type(err).__name__] += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(registrations)))
+        elapsed = time.perf_counter() - started
+
+    from src.app.database.config import dispose_engines
+
+    await dispose_engines()
+
+    latencies.sort()
+    return {
+        "registrations_per_s": statuses[200] / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "failed": registrations - statuses[200],
+    }
+
+
+def run_mode(mode: str, args) -> dict:
+    """Benchmark one mode in this process and return its results."""
+    workdir = Path(tempfile.mkdtemp(prefix="uyd-bench-"))
+    try:
+        db_path = workdir / "uyd.db"
+        shutil.copy(PROJECT_DIR / "uyd.db", db_path)
+        os.chdir(workdir)
+        os.environ["UYD_REGISTRATION_GROUP_COMMIT"] = MODES[mode]
+        sys.path.insert(0, str(PROJECT_DIR))
+
+        from src.app.database.migrate import init_db
+        from src.app.routes import app
+
+        # Migrate first so migrations are not part of the measurement
+        init_db()
+        event_id = create_event(db_path)
+        return asyncio.run(
+            run_burst(app, event_id, args.registrations, args.concurrency)
+        )
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--registrations", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args)))
+        return
+
+    results = {}
+    for mode in MODES:
+        output = subprocess.run(
+            [sys.executable, __file__, *sys.argv[1:], "--mode", mode],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results[mode] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{args.registrations} registrations, {args.concurrency} in flight")
+    print(f"{'mode':<22}{'reg/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'failed':>8}")
+    for mode, r in results.items():
+        print(
+            f"{mode:<22}{r['registrations_per_s']:>10.0f}{r['p50_ms']:>10.1f}"
+            f"{r['p99_ms']:>10.1f}{r['failed']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Cost of building a list response, ORM + response model vs row tuples.
+
+For each list endpoint's entity, loads a page of ``--rows`` rows and encodes
+it to JSON in two ways:
+
+- ``orm``: ``select(Model)``, then ``TypeAdapter(list[XResponse])``
+  validation from attributes and ``dump_json`` (the previous path)
+- ``rows``: ``select(*columns)`` row tuples encoded directly by
+  ``utils/serialization.py`` (the path the list endpoints use now)
+
+and reports the time per page for encoding alone and for query plus
+encoding. The two outputs are checked to be identical. Runs against a
+throwaway copy of ``uyd.db`` padded with generated rows:
+
+    python benchmarks/bench_serialization.py --rows 100 --iterations 200
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+# entity -> (table, list endpoint it backs)
+ENTITIES = {
+    "programs": ("programs", "GET /api/programs"),
+    "events": ("events", "GET /api/events"),
+    "news": ("news_articles", "GET /api/news"),
+}
+
+
+def pad_table(db_path: Path, table: str, rows: int) -> None:
+    """Copy existing rows until ``table`` holds at least ``rows`` active rows."""
+    conn = sqlite3.connect(db_path)
+    columns = [
+        row[1] for row in conn.execute(f"PRAGMA table_info({table})") if row[1] != "id"
+    ]
+    cols = ", ".join(columns)
+    while conn.execute(f"SELECT count(*) FROM {table}").fetchone()[0] < rows:
+        conn.execute(f"INSERT INTO {table} ({cols}) SELECT {cols} FROM {table}")
+    conn.execute(f"UPDATE {table} SET is_active = 1")
+    conn.commit()
+    conn.close()
+
+
+def per_call_ms(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+async def per_call_ms_async(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await fn()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+async def bench(rows: int, iterations: int) -> list:
+    from pydantic import TypeAdapter
+    from sqlalchemy import select
+
+    from src.app.database.config import AsyncSessionLocal, dispose_engines
+    from src.app.routes import api
+    from src.app.utils.serialization import dump_json, rows_to_dicts
+
+    setups = {
+        "programs": (api.Program, api.ProgramResponse, api._PROGRAM_COLUMNS),
+        "events": (api.Event, api.EventResponse, api._EVENT_COLUMNS),
+        "news": (api.NewsArticle, api.NewsArticleResponse, api._NEWS_COLUMNS),
+    }
+
+    results = []
+    async with AsyncSessionLocal() as db:
+        for entity, (model, schema, columns) in setups.items():
+            adapter = TypeAdapter(list[schema])
+
+            async def load_orm(model=model):
+                db.expunge_all()
+                return (await db.scalars(select(model).limit(rows))).all()
+
+            async def load_rows(columns=columns):
+                return (await db.execute(select(*columns).limit(rows))).all()
+
+            def encode_orm(objects, adapter=adapter):
+                return adapter.dump_json(adapter.validate_python(objects))
+
+            def encode_rows(tuples):
+                items = rows_to_dicts(tuples)
+                for item in items:
+                    item["featured_image_variants"] = None
+                return dump_json(items)
+
+            objects, tuples = await load_orm(), await load_rows()
+            if encode_orm(objects) != encode_rows(tuples):
+                raise SystemExit(f"{entity}: outputs differ")
+
+            async def full_orm(encode=encode_orm, load=load_orm):
+                encode(await load())
+
+            async def full_rows(encode=encode_rows, load=load_rows):
+                encode(await load())
+
+            results.append(
+                (
+                    entity,
+                    per_call_ms(lambda o=objects: encode_orm(o), iterations),
+                    per_call_ms(lambda t=tuples: encode_rows(t), iterations),
+                    await per_call_ms_async(full_orm, iterations),
+                    await per_call_ms_async(full_rows, iterations),
+                )
+            )
+    await dispose_engines()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="uyd-bench-"))
+    try:
+        db_path = workdir / "uyd.db"
+        shutil.copy(PROJECT_DIR / "uyd.db", db_path)
+        os.chdir(workdir)
+        sys.path.insert(0, str(PROJECT_DIR))
+
+        from src.app.database.migrate import init_db
+
+        init_db()
+        for table, _ in ENTITIES.values():
+            pad_table(db_path, table, args.rows)
+        results = asyncio.run(bench(args.rows, args.iterations))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    try:
+        import orjson  # noqa: F401
+
+        encoder = "orjson"
+    except ImportError:
+        encoder = "pydantic-core"
+    print(f"{args.rows}-row pages, {args.iterations} iterations, encoder: {encoder}")
+    print(
+        f"{'endpoint':<18}{'encode orm':>12}{'encode rows':>13}{'speedup':>9}"
+        f"{'total orm':>11}{'total rows':>12}{'speedup':>9}   (ms per page)"
+    )
+    for entity, enc_orm, enc_rows, full_orm, full_rows in results:
+        print(
+            f"{ENTITIES[entity][1]:<18}{enc_orm:>12.2f}{enc_rows:>13.2f}"
+            f"{enc_orm / enc_rows:>8.1f}x{full_orm:>11.2f}{full_rows:>12.2f}"
+            f"{full_orm / full_rows:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Cold import time and time to first served request for ``main:app``.
+
+Every measurement runs in a fresh interpreter against a throwaway copy of
+``uyd.db``, so the tracked database is not touched:
+
+- import: ``import main`` on its own. Importing must not touch the database
+  or the disk, so the working directory is also checked for files the
+  import created.
+- first request: from spawning ``uvicorn main:app`` until ``GET /`` is
+  answered with a 200, startup (schema check, pool, templates, prerendering,
+  cache priming) included. The copy is migrated beforehand, as a deploy
+  would with ``migrate_db.py``. It is measured with an empty template bytecode
+  cache and again with the cache the first start left behind, as a restarted
+  or additional worker would find it.
+
+    python benchmarks/bench_startup.py --runs 5
+"""
+
+import argparse
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+IMPORT_SCRIPT = (
+    "import time; started = time.perf_counter(); import main; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def bench_env(workdir: Path) -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(PROJECT_DIR)
+    env["UYD_TEMPLATE_CACHE_DIR"] = str(workdir / "jinja-cache")
+    return env
+
+
+def time_import(workdir: Path) -> tuple[float, list[str]]:
+    """Seconds to import ``main``, and any files the import created."""
+    before = set(os.listdir(workdir))
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=workdir,
+        env=bench_env(workdir),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    created = sorted(set(os.listdir(workdir)) - before)
+    return float(output.strip().splitlines()[-1]), created
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_first_request(workdir: Path, timeout: float = 60.0) -> float:
+    """Seconds from spawning the server until ``GET /`` returns 200."""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--app-dir",
+            str(PROJECT_DIR),
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=workdir,
+        env=bench_env(workdir),
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                sys.exit(f"Server exited with {server.returncode}")
+            try:
+                with urllib.request.urlopen(url, timeout=timeout) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.005)
+        sys.exit(f"No response from {url} within {timeout:.0f}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def run_once() -> dict:
+    workdir = Path(tempfile.mkdtemp(prefix="uyd-bench-"))
+    try:
+        shutil.copy(PROJECT_DIR / "uyd.db", workdir / "uyd.db")
+        import_seconds, created = time_import(workdir)
+        subprocess.run(
+            [sys.executable, str(PROJECT_DIR / "migrate_db.py")],
+            cwd=workdir,
+            env=bench_env(workdir),
+            check=True,
+            capture_output=True,
+        )
+        return {
+            "import": import_seconds,
+            "created": created,
+            "cold": time_first_request(workdir),
+            "warm": time_first_request(workdir),
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+
+    print(f"{args.runs} runs, median (min) in ms")
+    for key, label in (
+        ("import", "import main"),
+        ("cold", "first request, empty bytecode cache"),
+        ("warm", "first request, warm bytecode cache"),
+    ):
+        values = [r[key] * 1000 for r in runs]
+        print(f"{label:<38}{statistics.median(values):>10.1f} ({min(values):.1f})")
+
+    created = sorted({name for r in runs for name in r["created"]})
+    print("files created by import:", ", ".join(created) or "none")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Peak memory and event-loop blocking under concurrent image uploads.
+
+Compares the old ``save_upload_file`` (whole file read into memory, then
+written with a blocking ``open().write()`` on the event loop) with the
+streaming version used by the API routes. Each variant runs in its own
+subprocess so peak RSS is measured independently, and sends a burst of
+multipart uploads to ``POST /api/programs`` and ``POST /api/events`` while
+a ticker task measures how long the event loop is blocked.
+
+Runs against a throwaway copy of ``uyd.db`` with uploads written to a
+temporary directory, so neither the tracked database nor
+``src/assets/upload`` is touched:
+
+    python benchmarks/bench_uploads.py --uploads 40 --concurrency 20 --size-mb 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+API_KEY = "bench-key"
+
+VARIANTS = {
+    "legacy": "read + blocking write (before)",
+    "streaming": "chunked, threaded (after)",
+}
+
+
+async def legacy_save_upload_file(upload_file, upload_dir: Path) -> str:
+    """The pre-streaming implementation, kept for comparison."""
+    import uuid
+
+    from src.app.utils.image_upload import get_file_extension
+
+    await upload_file.seek(0)
+    unique_filename = f"{uuid.uuid4()}{get_file_extension(upload_file.filename)}"
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        contents = await upload_file.read()
+        with (upload_dir / unique_filename).open("wb") as f:
+            f.write(contents)
+        return f"assets/upload/{unique_filename}"
+    finally:
+        await upload_file.close()
+
+
+def write_sample_image(path: Path, size: int) -> None:
+    """A file with a JPEG signature padded with incompressible bytes."""
+    with path.open("wb") as f:
+        f.write(b"\xff\xd8\xff\xe0")
+        f.write(os.urandom(size - 4))
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def run_burst(app, image: Path, uploads: int, concurrency: int) -> dict:
+    """POST ``uploads`` images and record latency, loop lag and peak RSS."""
+    import httpx
+
+    lags = []
+    stop = asyncio.Event()
+
+    async def ticker():
+        interval = 0.001
+        while not stop.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - started - interval)
+
+    start_date = (datetime.now() + timedelta(days=30)).isoformat()
+    end_date = (datetime.now() + timedelta(days=31)).isoformat()
+    requests = [
+        (
+            "/api/programs",
+            {
+                "title": f"Upload {i}",
+                "description": "Bench",
+                "content": "Bench",
+                "category": "Leadership",
+            },
+        )
+        if i % 2 == 0
+        else (
+            "/api/events",
+            {
+                "title": f"Upload {i}",
+                "description": "Bench",
+                "content": "Bench",
+                "start_date": start_date,
+                "end_date": end_date,
+                "location": "Bench",
+                "event_type": "Leadership",
+            },
+        )
+        for i in range(uploads)
+    ]
+
+    latencies = []
+    slots = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+        headers={"X-API-Key": API_KEY},
+        timeout=None,
+    ) as client:
+
+        async def one(path: str, params: dict):
+            async with slots:
+                # An open file handle makes httpx stream the multipart body
+                with image.open("rb") as f:
+                    started = time.perf_counter()
+                    response = await client.post(
+                        path,
+                        params=params,
+                        files={"featured_image_file": ("photo.jpg", f, "image/jpeg")},
+                    )
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - started)
+
+        baseline = peak_rss_mb()
+        tick = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        await asyncio.gather(*(one(path, params) for path, params in requests))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await tick
+
+    from src.app.database.config import dispose_engines
+
+    await dispose_engines()
+
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "max_loop_block_ms": max(lags, default=0.0) * 1000,
+        "peak_rss_growth_mb": peak_rss_mb() - baseline,
+        "uploads_per_s": uploads / elapsed,
+    }
+
+
+def run_variant(variant: str, args) -> dict:
+    """Benchmark one variant in this process and return its results."""
+    workdir = Path(tempfile.mkdtemp(prefix="uyd-bench-"))
+    try:
+        shutil.copy(PROJECT_DIR / "uyd.db", workdir / "uyd.db")
+        image = workdir / "photo.jpg"
+        write_sample_image(image, int(args.size_mb * 1024 * 1024))
+        os.chdir(workdir)
+        os.environ["UYD_API_KEY"] = API_KEY
+        sys.path.insert(0, str(PROJECT_DIR))
+
+        from src.app.database.migrate import init_db
+        from src.app.routes import api, app
+
+        api.get_upload_directory = lambda: workdir / "upload"
+        if variant == "legacy":
+            api.save_upload_file = legacy_save_upload_file
+
+        # Migrate first so migrations are not part of the measurement
+        init_db()
+        return asyncio.run(run_burst(app, image, args.uploads, args.concurrency))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uploads", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--size-mb", type=float, default=8)
+    parser.add_argument("--variant", choices=VARIANTS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        print(json.dumps(run_variant(args.variant, args)))
+        return
+
+    results = {}
+    for variant, label in VARIANTS.items():
+        output = subprocess.run(
+            [sys.executable, __file__, *sys.argv[1:], "--variant", variant],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results[label] = json.loads(output.strip().splitlines()[-1])
+
+    print(
+        f"{args.uploads} uploads of {args.size_mb:g} MB, "
+        f"{args.concurrency} in flight, programs and events alternating"
+    )
+    print(
+        f"{'variant':<32}{'p50 ms':>10}{'loop block ms':>16}"
+        f"{'peak RSS +MB':>15}{'uploads/s':>12}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name:<32}{r['p50_ms']:>10.1f}{r['max_loop_block_ms']:>16.1f}"
+            f"{r['peak_rss_growth_mb']:>15.1f}{r['uploads_per_s']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
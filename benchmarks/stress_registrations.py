@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Concurrency stress test for ``POST /api/events/register``.
+
+Creates an event with ``--capacity`` seats, then fires ``--requests``
+simultaneous signups at it. Every ``--duplicate-every``-th request reuses an
+earlier person's email or mobile number, and half of the requests ask for
+the waitlist. Afterwards it checks the invariants and exits non-zero if any
+is broken:
+
+- confirmed registrations never exceed the capacity
+- ``events.registered_count`` equals the confirmed registrations
+- nobody is registered twice by email or mobile number
+- every request got exactly one of: registered, waitlisted, full, duplicate
+
+Runs against a throwaway copy of ``uyd.db``:
+
+    python benchmarks/stress_registrations.py --requests 500 --capacity 50
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+
+def signup(i: int, duplicate_every: int) -> dict:
+    email_id = mobile_id = i
+    if duplicate_every and i and i % duplicate_every == 0:
+        # Collide with the previous person on one of the two unique keys
+        if (i // duplicate_every) % 2:
+            email_id = i - 1
+        else:
+            mobile_id = i - 1
+    return {
+        "user_name": f"Stress User {i}",
+        "user_email": f"user{email_id}@example.com",
+        "user_mobile_number": f"0712{mobile_id:06d}",
+        "waitlist": i % 2 == 1,
+    }
+
+
+def classify(response) -> str:
+    if response.status_code == 200:
+        return "waitlisted" if response.json()["waitlisted"] else "registered"
+    if response.status_code == 409:
+        return "full"
+    if response.status_code == 400 and "already registered" in response.text:
+        return "duplicate"
+    return f"error {response.status_code}: {response.text[:80]}"
+
+
+async def run(app, event_id: int, requests: int, duplicate_every: int) -> Counter:
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://stress", timeout=None
+    ) as client:
+
+        async def one(i: int) -> str:
+            response = await client.post(
+                "/api/events/register",
+                json={"event_id": event_id, **signup(i, duplicate_every)},
+            )
+            return classify(response)
+
+        outcomes = await asyncio.gather(*(one(i) for i in range(requests)))
+
+    from src.app.database.config import dispose_engines
+
+    await dispose_engines()
+    return Counter(outcomes)
+
+
+def check(db_path: Path, event_id: int, capacity: int, outcomes: Counter) -> list:
+    conn = sqlite3.connect(db_path)
+    confirmed, waitlisted = conn.execute(
+        "SELECT sum(NOT is_waitlisted), sum(is_waitlisted) "
+        "FROM event_registrations WHERE event_id = ?",
+        (event_id,),
+    ).fetchone()
+    (registered_count,) = conn.execute(
+        "SELECT registered_count FROM events WHERE id = ?", (event_id,)
+    ).fetchone()
+    duplicate_emails = conn.execute(
+        "SELECT count(*) FROM (SELECT 1 FROM event_registrations WHERE event_id = ? "
+        "GROUP BY user_email HAVING count(*) > 1)",
+        (event_id,),
+    ).fetchone()[0]
+    duplicate_mobiles = conn.execute(
+        "SELECT count(*) FROM (SELECT 1 FROM event_registrations WHERE event_id = ? "
+        "GROUP BY user_mobile_number HAVING count(*) > 1)",
+        (event_id,),
+    ).fetchone()[0]
+    conn.close()
+
+    failures = []
+    if confirmed > capacity:
+        failures.append(f"overbooked: {confirmed} confirmed for {capacity} seats")
+    if registered_count != confirmed:
+        failures.append(
+            f"registered_count is {registered_count}, {confirmed} rows confirmed"
+        )
+    if duplicate_emails or duplicate_mobiles:
+        failures.append(
+            f"duplicates: {duplicate_emails} emails, {duplicate_mobiles} mobiles"
+        )
+    if outcomes["registered"] != confirmed or outcomes["waitlisted"] != waitlisted:
+        failures.append("responses do not match the stored registrations")
+    errors = [outcome for outcome in outcomes if outcome.startswith("error")]
+    if errors:
+        failures.append(f"unexpected responses: {errors}")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--capacity", type=int, default=50)
+    parser.add_argument("--duplicate-every", type=int, default=10)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="uyd-stress-"))
+    try:
+        db_path = workdir / "uyd.db"
+        shutil.copy(PROJECT_DIR / "uyd.db", db_path)
+        os.chdir(workdir)
+        sys.path.insert(0, str(PROJECT_DIR))
+
+        from src.app.database.migrate import init_db
+        from src.app.routes import app
+
+        # Migrate the copy, then add the event under test
+        init_db()
+        conn = sqlite3.connect(db_path)
+        start = datetime.now() + timedelta(days=7)
+        event_id = conn.execute(
+            "INSERT INTO events (title, description, event_type, start_date, "
+            "end_date, location, max_participants, registration_deadline, "
+            "created_at, updated_at, is_featured, is_active, registered_count) "
+            "VALUES ('Stress test', 'Stress test', 'Leadership', ?, ?, 'Online', "
+            "?, ?, datetime('now'), datetime('now'), 0, 1, 0)",
+            (start, start + timedelta(hours=2), args.capacity, start),
+        ).lastrowid
+        conn.commit()
+        conn.close()
+
+        started = time.perf_counter()
+        outcomes = asyncio.run(run(app, event_id, args.requests, args.duplicate_every))
+        elapsed = time.perf_counter() - started
+        failures = check(db_path, event_id, args.capacity, outcomes)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(
+        f"{args.requests} simultaneous signups for {args.capacity} seats "
+        f"in {elapsed:.2f}s ({args.requests / elapsed:.0f} req/s)"
+    )
+    for outcome, count in sorted(outcomes.items()):
+        print(f"  {outcome:<12}{count:>6}")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if not failures:
+        print("OK: no overbooking, no duplicates, counter in step")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""Build fingerprinted, precompressed copies of ``src/assets``.
+
+Writes content-hashed files, ``.gz``/``.br`` sidecars and ``manifest.json``
+to ``src/dist`` (``UYD_ASSET_BUILD_DIR``). Run it after changing anything
+under ``src/assets`` and before starting the server:
+
+    python build_assets.py
+"""
+
+import sys
+
+from src.app.utils.assets import ASSET_BUILD_DIR, brotli, build_assets
+
+
+def main() -> int:
+    manifest = build_assets()
+    sidecars = sum(1 for _ in ASSET_BUILD_DIR.rglob("*.gz")) + sum(
+        1 for _ in ASSET_BUILD_DIR.rglob("*.br")
+    )
+    print(f"{len(manifest)} assets fingerprinted, {sidecars} compressed sidecars")
+    if brotli is None:
+        print("brotli is not installed; only gzip sidecars were written")
+    print(f"Manifest: {ASSET_BUILD_DIR / 'manifest.json'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Fail if any endpoint query falls back to a full table scan.
+
+Requests every read endpoint against a migrated throwaway copy of
+``uyd.db``, records the SQL each one sends to SQLite, and runs
+``EXPLAIN QUERY PLAN`` on it with the same parameters. Any plan step that
+scans a table without an index is reported, and the script exits non-zero.
+So does any request that does not answer 200, since a failed request sends
+fewer queries than it should and would otherwise pass unnoticed:
+
+    python check_query_plans.py
+"""
+
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent
+
+# Endpoints and query strings to exercise; every branch of each handler
+ENDPOINTS = [
+    "/api/programs",
+    "/api/programs?category=Leadership",
+    "/api/programs?featured=true",
+    "/api/programs?limit=1",
+    "/api/programs?cursor={programs}",
+    "/api/programs?fields=id,title",
+    "/api/programs?fields=*",
+    "/api/programs?ids=2,1,999",
+    "/api/programs/featured",
+    "/api/programs/featured?fields=id,title",
+    "/api/programs/1",
+    "/api/events",
+    "/api/events?event_type=Leadership",
+    "/api/events?featured=true",
+    "/api/events?upcoming=true",
+    "/api/events?limit=1",
+    "/api/events?cursor={events}",
+    "/api/events?fields=id,title,start_date",
+    "/api/events?ids=2,1,999",
+    "/api/events?upcoming=true&fields=*",
+    "/api/events/upcoming",
+    "/api/events/upcoming?fields=id,title",
+    "/api/events/1",
+    "/api/news",
+    "/api/news?category=events",
+    "/api/news?featured=true",
+    "/api/news?limit=1",
+    "/api/news?cursor={news}",
+    "/api/news?fields=id,title",
+    "/api/news?ids=2,1,999",
+    "/api/news/latest",
+    "/api/news/featured",
+    "/api/news/1",
+    "/api/core/stats",
+    "/api/core/home",
+    "/api/search?q=youth",
+    "/api/search?q=youth&type=events&type=news",
+    "/api/events/registrations/export",
+    "/api/events/1/registrations/export?format=ndjson",
+    "/events",
+    "/events?search=youth",
+    "/events?event_type=Leadership",
+    "/event-details?id={event}",
+    "/news",
+    "/news?page=2",
+    "/news?category=events",
+    "/news?search=youth",
+    "/news-details?id=1",
+    "/programs",
+    "/programs?category=leadership",
+]
+
+# Sub-requests of each POST /api/batch, which share one snapshot session
+BATCHES = [
+    ["/api/events/{event}", "/api/news?ids=1,2", "/api/programs?fields=id,title"],
+    ["/api/core/home", "/api/events/upcoming", "/api/news/latest"],
+]
+
+# Sent with every request, for the endpoints that require it
+API_KEY = "check-query-plans"
+
+# Plans that have to read the whole table, by endpoint
+EXPECTED_SCANS = {
+    # Exports every registration, in id order
+    "/api/events/registrations/export": {"SCAN event_registrations"},
+}
+
+# "SCAN programs" is a table scan; "SCAN programs USING INDEX ..." and
+# "SCAN events_fts VIRTUAL TABLE INDEX ..." are not.
+TABLE_SCAN = re.compile(r"^SCAN (?!CONSTANT ROW)(\S+)(?: AS \S+)?$")
+
+
+def capture_queries(workdir: Path) -> tuple[list[tuple[str, str, tuple]], list[str]]:
+    """Hit every endpoint and collect ``(endpoint, sql, params)`` for SELECTs.
+
+    Also returns a description of every response that was not a 200.
+    """
+    os.chdir(workdir)
+    os.environ["UYD_API_KEY"] = API_KEY
+    sys.path.insert(0, str(PROJECT_DIR))
+
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+
+    from src.app.database.config import get_async_engine
+    from src.app.database.migrate import init_db
+    from src.app.routes import app
+    from src.app.utils.pagination import encode_cursor
+    from src.app.utils.response_cache import response_cache
+
+    captured = []
+    current = {"endpoint": None}
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.append((current["endpoint"], statement, tuple(parameters)))
+
+    event.listen(get_async_engine().sync_engine, "before_cursor_execute", record)
+
+    init_db()
+    values = {
+        "programs": encode_cursor(1),
+        "events": encode_cursor(datetime_now(), 1),
+        "news": encode_cursor(datetime_now(), 1),
+        "event": add_upcoming_event(workdir / "uyd.db"),
+    }
+    errors = []
+    with TestClient(app, headers={"X-API-Key": API_KEY}) as client:
+        for endpoint in ENDPOINTS:
+            url = endpoint.format(**values)
+            current["endpoint"] = url
+            response_cache.clear()
+            response = client.get(url)
+            if response.status_code != 200:
+                errors.append(f"GET {url} returned {response.status_code}")
+        for batch in BATCHES:
+            paths = [path.format(**values) for path in batch]
+            current["endpoint"] = f"POST /api/batch {paths}"
+            response_cache.clear()
+            response = client.post("/api/batch", json={"requests": paths})
+            if response.status_code != 200:
+                errors.append(f"{current['endpoint']} returned {response.status_code}")
+                continue
+            errors.extend(
+                f"GET {result['path']} in a batch returned {result['status']}"
+                for result in response.json()
+                if result["status"] != 200
+            )
+    return captured, errors
+
+
+def add_upcoming_event(db_path: Path) -> int:
+    """Insert an event that has not ended, so its details page is served."""
+    from datetime import timedelta
+
+    start = datetime_now() + timedelta(days=7)
+    conn = sqlite3.connect(db_path)
+    try:
+        event_id = conn.execute(
+            "INSERT INTO events (title, description, event_type, start_date, "
+            "end_date, location, created_at, updated_at, is_featured, is_active, "
+            "registered_count) VALUES ('Query plan check', 'Query plan check', "
+            "'Leadership', ?, ?, 'Online', datetime('now'), datetime('now'), "
+            "0, 1, 0)",
+            (start, start + timedelta(hours=2)),
+        ).lastrowid
+        conn.commit()
+    finally:
+        conn.close()
+    return event_id
+
+
+def datetime_now():
+    from src.app.database.tables import utcnow
+
+    return utcnow()
+
+
+def table_scans(db_path: Path, sql: str, params: tuple) -> list[str]:
+    conn = sqlite3.connect(db_path)
+    try:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    finally:
+        conn.close()
+    return [detail for *_, detail in plan if TABLE_SCAN.match(detail)]
+
+
+def main() -> int:
+    workdir = Path(tempfile.mkdtemp(prefix="uyd-plans-"))
+    try:
+        shutil.copy(PROJECT_DIR / "uyd.db", workdir / "uyd.db")
+        queries, errors = capture_queries(workdir)
+
+        for error in errors:
+            print(f"FAIL {error}")
+        failures = 0
+        for endpoint, sql, params in queries:
+            scans = table_scans(workdir / "uyd.db", sql, params)
+            scans = [s for s in scans if s not in EXPECTED_SCANS.get(endpoint, ())]
+            if scans:
+                failures += 1
+                print(f"FAIL {endpoint}: {', '.join(scans)}")
+                print(f"     {' '.join(sql.split())}")
+        print(
+            f"{len(queries)} queries checked, {failures} with table scans, "
+            f"{len(errors)} failed requests"
+        )
+        return 1 if failures or errors else 0
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Remove uploaded images that no program, event or news article uses.
+
+Deletes unreferenced files and their resized variants from
+``src/assets/upload``, drops their ``images`` rows, and prunes empty shard
+directories. Files younger than ``--min-age`` seconds are kept, so uploads
+still being saved are never touched. Safe to run from cron:
+
+    python gc_uploads.py --dry-run
+"""
+
+import argparse
+import asyncio
+
+from dotenv import load_dotenv
+
+# Use the same settings as the server
+load_dotenv()
+
+from src.app.database.config import AsyncSessionLocal, dispose_engines, init_engines
+from src.app.utils.upload_store import GC_GRACE_SECONDS, collect_garbage
+
+
+async def run(min_age: float, dry_run: bool):
+    init_engines()
+    try:
+        async with AsyncSessionLocal() as db:
+            return await collect_garbage(db, min_age=min_age, dry_run=dry_run)
+    finally:
+        await dispose_engines()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-age", type=float, default=GC_GRACE_SECONDS)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.min_age, args.dry_run))
+    verb = "Would remove" if args.dry_run else "Removed"
+    print(
+        f"{verb} {report.files_removed} files "
+        f"({report.bytes_freed / (1024 * 1024):.1f} MB) "
+        f"and {report.images_removed} image records"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Bulk import programs, events or news articles from an NDJSON file.
+
+Each line is one JSON object with the fields of the create endpoints. Lines
+with an ``id`` update that row (or create it with that id), the rest are
+inserted. Invalid lines are reported and skipped:
+
+    python import_data.py events events.ndjson
+    cat news.ndjson | python import_data.py news -
+
+By default rows are written straight to the database. Running servers then
+pick them up once their response cache expires. Pass ``--url`` to send the
+file to a running server's ``/api/import`` endpoint instead, which
+invalidates its cache immediately:
+
+    python import_data.py programs programs.ndjson --url http://localhost:8000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+
+from dotenv import load_dotenv
+
+# Use the same settings as the server
+load_dotenv()
+
+from src.app.database.bulk_import import (
+    IMPORT_CHUNK_SIZE,
+    IMPORT_ENTITIES,
+    MAX_IMPORT_CHUNK_SIZE,
+    import_ndjson,
+)
+from src.app.database.config import AsyncSessionLocal, dispose_engines
+from src.app.database.migrate import init_db
+
+READ_SIZE = 64 * 1024
+
+
+async def read_chunks(stream):
+    while chunk := stream.read(READ_SIZE):
+        yield chunk
+
+
+async def import_local(entity: str, stream, chunk_size: int) -> dict:
+    init_db()
+    try:
+        async with AsyncSessionLocal() as db:
+            report = await import_ndjson(db, entity, read_chunks(stream), chunk_size)
+    finally:
+        await dispose_engines()
+    return vars(report)
+
+
+def import_remote(entity: str, stream, chunk_size: int, url: str) -> dict:
+    # A body without a length is sent with chunked transfer encoding
+    request = urllib.request.Request(
+        f"{url.rstrip('/')}/api/import/{entity}?chunk_size={chunk_size}",
+        data=iter(lambda: stream.read(READ_SIZE), b""),
+        headers={
+            "Content-Type": "application/x-ndjson",
+            "X-API-Key": os.getenv("UYD_API_KEY", ""),
+        },
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return json.load(response)
+    except urllib.error.HTTPError as err:
+        sys.exit(f"Import failed: {err.code} {err.read().decode()}")
+
+
+def run_import(args, stream) -> dict:
+    if args.url:
+        return import_remote(args.entity, stream, args.chunk_size, args.url)
+    return asyncio.run(import_local(args.entity, stream, args.chunk_size))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("entity", choices=IMPORT_ENTITIES)
+    parser.add_argument("file", help="NDJSON file, or - for standard input")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=IMPORT_CHUNK_SIZE,
+        choices=range(1, MAX_IMPORT_CHUNK_SIZE + 1),
+        metavar=f"1-{MAX_IMPORT_CHUNK_SIZE}",
+    )
+    parser.add_argument(
+        "--url", help="Base URL of a running server; uses UYD_API_KEY from the env"
+    )
+    args = parser.parse_args()
+
+    if args.file == "-":
+        report = run_import(args, sys.stdin.buffer)
+    else:
+        with open(args.file, "rb") as stream:
+            report = run_import(args, stream)
+
+    print(
+        f"{report['inserted']} inserted, {report['updated']} updated, "
+        f"{report['failed']} failed"
+    )
+    for error in report["errors"]:
+        print(f"  line {error['line']}: {error['error']}")
+    if report["failed"] > len(report["errors"]):
+        print(f"  ... and {report['failed'] - len(report['errors'])} more")
+    sys.exit(1 if report["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 """API entry point."""
 
 import uvicorn
+from dotenv import load_dotenv
+
+# Settings are read when the app modules are imported, so load .env first
+load_dotenv()
 
 from src.app.routes import app
 
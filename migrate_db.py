@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""Apply pending migrations.
+
+Run once per deploy, before the server workers start; each worker only
+checks that the schema is current:
+
+    python migrate_db.py
+"""
+
+from dotenv import load_dotenv
+
+# Settings are read when the app modules are imported, so load .env first
+load_dotenv()
+
+from src.app.database.migrate import init_db
+
+if __name__ == "__main__":
+    init_db()
+    print("Database schema is up to date")
@@ -0,0 +1,73 @@
+"""Alembic environment for the UYD database."""
+
+from logging.config import fileConfig
+
+from alembic import context
+
+from src.app.database.config import DATABASE_URL, get_engine
+from src.app.database.tables import Base
+
+config = context.config
+
+# Skip logging setup when migrations run inside the app (upgrade_database)
+if config.config_file_name is not None and config.attributes.get(
+    "configure_logger", True
+):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+
+def include_name(name, type_, parent_names) -> bool:
+    """Leave tables managed outside Alembic out of autogenerate.
+
+    Those are the stats counters and the FTS5 search tables, created with
+    raw SQL by revisions 0005 and 0006.
+    """
+    return not (type_ == "table" and ("_fts" in name or name == "site_stats"))
+
+
+def run_migrations_offline() -> None:
+    """Emit migration SQL without a database connection."""
+    context.configure(
+        url=DATABASE_URL,
+        target_metadata=target_metadata,
+        include_name=include_name,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Run migrations on the app engine, or on a connection passed in."""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_with(connection)
+        return
+
+    with get_engine().connect() as connection:
+        _run_with(connection)
+
+
+def _run_with(connection) -> None:
+    # SQLite cannot ALTER most constraints in place; batch mode recreates
+    # the table instead when a migration needs it.
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+        render_as_batch=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,115 @@
+"""Initial schema
+
+Mirrors the tables that ``Base.metadata.create_all`` used to create at
+import time. Databases created that way already have these tables, so each
+one is only created when missing and existing files are adopted as-is.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: str | Sequence[str] | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _create_indexes(table: str, columns: list[str]) -> None:
+    for column in columns:
+        op.create_index(f"ix_{table}_{column}", table, [column], if_not_exists=True)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "programs" not in existing:
+        op.create_table(
+            "programs",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("title", sa.String(), nullable=True),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("category", sa.String(), nullable=True),
+            sa.Column("content", sa.Text(), nullable=True),
+            sa.Column("featured_image", sa.String(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.Column("is_featured", sa.Boolean(), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+    _create_indexes("programs", ["id", "title", "category"])
+
+    if "events" not in existing:
+        op.create_table(
+            "events",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("title", sa.String(), nullable=True),
+            sa.Column("description", sa.Text(), nullable=True),
+            sa.Column("event_type", sa.String(), nullable=True),
+            sa.Column("start_date", sa.DateTime(), nullable=True),
+            sa.Column("end_date", sa.DateTime(), nullable=True),
+            sa.Column("location", sa.String(), nullable=True),
+            sa.Column("max_participants", sa.Integer(), nullable=True),
+            sa.Column("featured_image", sa.String(), nullable=True),
+            sa.Column("content", sa.Text(), nullable=True),
+            sa.Column("registration_deadline", sa.DateTime(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.Column("is_featured", sa.Boolean(), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+    _create_indexes("events", ["id", "title", "event_type"])
+
+    if "news_articles" not in existing:
+        op.create_table(
+            "news_articles",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("title", sa.String(), nullable=True),
+            sa.Column("content", sa.Text(), nullable=True),
+            sa.Column("excerpt", sa.String(length=500), nullable=True),
+            sa.Column("category", sa.String(), nullable=True),
+            sa.Column("author", sa.String(), nullable=True),
+            sa.Column("publish_date", sa.DateTime(), nullable=True),
+            sa.Column("featured_image", sa.String(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.Column("is_featured", sa.Boolean(), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+    _create_indexes("news_articles", ["id", "title", "category"])
+
+    if "event_registrations" not in existing:
+        op.create_table(
+            "event_registrations",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("event_id", sa.Integer(), nullable=True),
+            sa.Column("user_name", sa.String(), nullable=True),
+            sa.Column("user_email", sa.String(), nullable=True),
+            sa.Column("user_mobile_number", sa.String(), nullable=True),
+            sa.Column("registration_date", sa.DateTime(), nullable=True),
+            sa.Column("is_confirmed", sa.Boolean(), nullable=True),
+            sa.ForeignKeyConstraint(["event_id"], ["events.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+    _create_indexes(
+        "event_registrations", ["id", "user_name", "user_email", "user_mobile_number"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("event_registrations")
+    op.drop_table("news_articles")
+    op.drop_table("events")
+    op.drop_table("programs")
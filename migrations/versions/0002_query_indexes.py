@@ -0,0 +1,106 @@
+"""Composite and partial indexes for the hot read queries
+
+Every index here backs a specific query in routes/api.py or routes/pages.py.
+Active-row filters are written as ``is_active = 1`` in those queries so
+SQLite can seek on the leading ``is_active`` column, and so the partial
+index's WHERE clause matches the query term exactly.
+
+``ix_news_articles_*_publish`` are ascending on purpose. The news lists
+order by ``publish_date DESC, id DESC``, and a backwards scan of an
+ascending index yields exactly that order, rowid tie-break included. A
+DESC index would still need a temp B-tree for the ``id`` tie-break.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 00:00:01
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: str | Sequence[str] | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (name, table, columns, partial WHERE clause)
+INDEXES = [
+    # GET /api/programs: the implicit rowid suffix gives ORDER BY id for free
+    ("ix_programs_is_active", "programs", ["is_active"], None),
+    ("ix_programs_active_category", "programs", ["is_active", "category"], None),
+    # GET /api/programs/featured, partial so it only holds active rows
+    ("ix_programs_featured", "programs", ["is_featured"], "is_active = 1"),
+    # max(updated_at) for ETags
+    ("ix_programs_updated_at", "programs", ["updated_at"], None),
+    # GET /api/events and /api/events/upcoming: ORDER BY start_date, id
+    ("ix_events_active_start", "events", ["is_active", "start_date"], None),
+    (
+        "ix_events_active_type_start",
+        "events",
+        ["is_active", "event_type", "start_date"],
+        None,
+    ),
+    # /events page: end_date >= now, GROUP BY event_type
+    (
+        "ix_events_active_end_type",
+        "events",
+        ["is_active", "end_date", "event_type"],
+        None,
+    ),
+    ("ix_events_updated_at", "events", ["updated_at"], None),
+    # GET /api/news and /api/news/latest: ORDER BY publish_date DESC, id DESC
+    (
+        "ix_news_articles_active_publish",
+        "news_articles",
+        ["is_active", "publish_date"],
+        None,
+    ),
+    (
+        "ix_news_articles_active_featured_publish",
+        "news_articles",
+        ["is_active", "is_featured", "publish_date"],
+        None,
+    ),
+    (
+        "ix_news_articles_active_category_publish",
+        "news_articles",
+        ["is_active", "category", "publish_date"],
+        None,
+    ),
+    ("ix_news_articles_updated_at", "news_articles", ["updated_at"], None),
+    # Duplicate-registration lookup in POST /api/events/register
+    (
+        "ix_event_registrations_event_email",
+        "event_registrations",
+        ["event_id", "user_email"],
+        None,
+    ),
+    (
+        "ix_event_registrations_event_mobile",
+        "event_registrations",
+        ["event_id", "user_mobile_number"],
+        None,
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns, where in INDEXES:
+        op.create_index(
+            name,
+            table,
+            columns,
+            if_not_exists=True,
+            sqlite_where=sa.text(where) if where else None,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
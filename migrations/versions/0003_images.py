@@ -0,0 +1,52 @@
+"""Image variants table and featured_image indexes
+
+``images`` records the dimensions and resized WebP/AVIF variants generated
+for each uploaded featured image. The ``featured_image`` indexes let the
+variant job find every row that uses a finished image.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 00:00:02
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: str | Sequence[str] | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+FEATURED_IMAGE_TABLES = ["programs", "events", "news_articles"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "images",
+        sa.Column("path", sa.String(), nullable=False),
+        sa.Column("width", sa.Integer(), nullable=True),
+        sa.Column("height", sa.Integer(), nullable=True),
+        sa.Column("srcset", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("path"),
+        if_not_exists=True,
+    )
+    for table in FEATURED_IMAGE_TABLES:
+        op.create_index(
+            f"ix_{table}_featured_image",
+            table,
+            ["featured_image"],
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in FEATURED_IMAGE_TABLES:
+        op.drop_index(f"ix_{table}_featured_image", table_name=table, if_exists=True)
+    op.drop_table("images", if_exists=True)
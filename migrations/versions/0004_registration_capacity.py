@@ -0,0 +1,82 @@
+"""Unique registrations, seat counter and waitlist
+
+Makes ``(event_id, user_email)`` and ``(event_id, user_mobile_number)``
+unique so concurrent signups cannot create duplicates. The plain indexes
+from 0002 on the same columns are replaced by the unique ones. Duplicates
+that already exist are removed first, keeping the earliest registration.
+
+``events.registered_count`` is the number of confirmed seats taken. The
+registration route increments it with a conditional UPDATE that fails once
+``max_participants`` is reached, so capacity is enforced atomically.
+``event_registrations.is_waitlisted`` marks signups accepted after that.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 00:00:03
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: str | Sequence[str] | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (old plain index, new unique index, columns)
+UNIQUE_INDEXES = [
+    (
+        "ix_event_registrations_event_email",
+        "uq_event_registrations_event_email",
+        ["event_id", "user_email"],
+    ),
+    (
+        "ix_event_registrations_event_mobile",
+        "uq_event_registrations_event_mobile",
+        ["event_id", "user_mobile_number"],
+    ),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for old_name, new_name, columns in UNIQUE_INDEXES:
+        op.execute(
+            "DELETE FROM event_registrations WHERE id NOT IN ("
+            f"SELECT min(id) FROM event_registrations GROUP BY {', '.join(columns)})"
+        )
+        op.drop_index(old_name, table_name="event_registrations", if_exists=True)
+        op.create_index(new_name, "event_registrations", columns, unique=True)
+
+    with op.batch_alter_table("event_registrations") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "is_waitlisted", sa.Boolean(), nullable=False, server_default=sa.false()
+            )
+        )
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "registered_count", sa.Integer(), nullable=False, server_default="0"
+            )
+        )
+    op.execute(
+        "UPDATE events SET registered_count = ("
+        "SELECT count(*) FROM event_registrations r "
+        "WHERE r.event_id = events.id AND r.is_waitlisted = 0)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("events") as batch_op:
+        batch_op.drop_column("registered_count")
+    with op.batch_alter_table("event_registrations") as batch_op:
+        batch_op.drop_column("is_waitlisted")
+    for old_name, new_name, columns in UNIQUE_INDEXES:
+        op.drop_index(new_name, table_name="event_registrations")
+        op.create_index(old_name, "event_registrations", columns)
@@ -0,0 +1,98 @@
+"""Trigger-maintained site stats counters
+
+``site_stats`` holds one row per counter served by ``/api/core/stats``.
+Triggers on the counted tables adjust it in the same transaction as every
+insert, delete and flag change, so the counts are backfilled once here and
+never recomputed. The registrations counter leaves out waitlisted signups.
+
+Databases that already have the table and triggers from the startup code
+this replaces get the triggers recreated and the counters recounted.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 00:00:04
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: str | Sequence[str] | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+STATS_TABLE = "site_stats"
+
+# counter -> (table, flag column, flag value of the rows that count)
+COUNTERS = {
+    "programs": ("programs", "is_active", 1),
+    "events": ("events", "is_active", 1),
+    "news": ("news_articles", "is_active", 1),
+    "registrations": ("event_registrations", "is_waitlisted", 0),
+}
+
+
+def _trigger_names(name: str) -> list[str]:
+    return [f"{STATS_TABLE}_{name}_{suffix}" for suffix in ("ai", "ad", "au")]
+
+
+def _counter_ddl(name: str, table: str, flag: str, value: int) -> list[str]:
+    insert, delete, update = _trigger_names(name)
+
+    def bump(delta: str) -> str:
+        return (
+            f"UPDATE {STATS_TABLE} SET value = value + {delta} WHERE name = '{name}';"
+        )
+
+    counted_new = f"(new.{flag} = {value})"
+    counted_old = f"(old.{flag} = {value})"
+    return [
+        (
+            f"CREATE TRIGGER {insert} AFTER INSERT ON {table} "
+            f"WHEN {counted_new} BEGIN {bump('1')} END"
+        ),
+        (
+            f"CREATE TRIGGER {delete} AFTER DELETE ON {table} "
+            f"WHEN {counted_old} BEGIN {bump('-1')} END"
+        ),
+        # Soft deletes, restores and waitlist promotions flip the flag
+        (
+            f"CREATE TRIGGER {update} AFTER UPDATE OF {flag} ON {table} "
+            f"WHEN {counted_new} IS NOT {counted_old} "
+            f"BEGIN {bump(f'{counted_new} - {counted_old}')} END"
+        ),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    op.execute(
+        f"CREATE TABLE IF NOT EXISTS {STATS_TABLE} "
+        "(name TEXT PRIMARY KEY, value INTEGER NOT NULL) WITHOUT ROWID"
+    )
+    for name, (table, flag, value) in COUNTERS.items():
+        for trigger in _trigger_names(name):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        for statement in _counter_ddl(name, table, flag, value):
+            op.execute(statement)
+        op.execute(
+            f"INSERT OR REPLACE INTO {STATS_TABLE} (name, value) "
+            f"SELECT '{name}', count(*) FROM {table} WHERE {flag} = {value}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    for name in COUNTERS:
+        for trigger in _trigger_names(name):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute(f"DROP TABLE IF EXISTS {STATS_TABLE}")
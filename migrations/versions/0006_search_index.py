@@ -0,0 +1,87 @@
+"""FTS5 full-text search indexes
+
+Each searchable table gets an external-content FTS5 index (``<table>_fts``)
+kept in step by insert, delete and update triggers, and is filled from the
+existing rows with the FTS5 ``'rebuild'`` command.
+
+Databases that already have the indexes from the ``init_db()`` code this
+replaces get the triggers recreated and the indexes rebuilt.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 00:00:05
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: str | Sequence[str] | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# table -> indexed columns, in the bm25 weight order search.py uses
+SEARCH_TABLES = {
+    "events": ("title", "description", "content"),
+    "news_articles": ("title", "excerpt", "content"),
+    "programs": ("title", "description", "content"),
+}
+
+
+def _trigger_names(table: str) -> list[str]:
+    return [f"{table}_fts_{suffix}" for suffix in ("ai", "ad", "au")]
+
+
+def _index_ddl(table: str, columns: tuple[str, ...]) -> list[str]:
+    fts = f"{table}_fts"
+    insert, delete, update = _trigger_names(table)
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    insert_new = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values});"
+    return [
+        (
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+            f"{cols}, content='{table}', content_rowid='id', "
+            "tokenize='porter unicode61 remove_diacritics 2')"
+        ),
+        f"CREATE TRIGGER {insert} AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER {delete} AFTER DELETE ON {table} BEGIN {delete_old} END",
+        # Only re-index when searchable text changes, not on is_active toggles
+        (
+            f"CREATE TRIGGER {update} AFTER UPDATE OF {cols} ON {table} "
+            f"BEGIN {delete_old} {insert_new} END"
+        ),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    for table, columns in SEARCH_TABLES.items():
+        fts = f"{table}_fts"
+        for trigger in _trigger_names(table):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        for statement in _index_ddl(table, columns):
+            op.execute(statement)
+        op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    for table in SEARCH_TABLES:
+        for trigger in _trigger_names(table):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute(f"DROP TABLE IF EXISTS {table}_fts")
@@ -21,6 +21,9 @@ def run_server():
     os.chdir(project_dir)
 
     try:
+        # Apply migrations once, before the server starts
+        subprocess.run([sys.executable, "migrate_db.py"], check=True)
+
         # Run uvicorn with auto-reload
         cmd = [
             sys.executable,
@@ -36,7 +39,9 @@ def run_server():
             "info",
         ]
 
-        subprocess.run(cmd, check=True)
+        # Pick up edited templates while developing, unless told otherwise
+        env = {"UYD_TEMPLATE_AUTO_RELOAD": "1", **os.environ}
+        subprocess.run(cmd, check=True, env=env)
 
     except KeyboardInterrupt:
         print("\nServer stopped by user")
@@ -1,9 +1,15 @@
 """Seed script to populate UYD database with sample programs and events."""
 
-from datetime import datetime, timedelta
+from datetime import timedelta
+
+from dotenv import load_dotenv
+
+# Use the same settings as the server
+load_dotenv()
 
 from src.app.database.config import SessionLocal
-from src.app.database.tables import Event, NewsArticle, Program
+from src.app.database.migrate import init_db
+from src.app.database.tables import Event, NewsArticle, Program, utcnow
 
 
 def seed_programs(db):
@@ -141,7 +147,7 @@ def seed_programs(db):
 
 def seed_events(db):
     """Seed the database with sample events"""
-    base_date = datetime.utcnow()
+    base_date = utcnow()
 
     events_data = [
         {
@@ -264,7 +270,7 @@ def seed_events(db):
 
 def seed_news(db):
     """Seed the database with sample news articles"""
-    base_date = datetime.utcnow()
+    base_date = utcnow()
 
     news_data = [
         {
@@ -323,6 +329,7 @@ def seed_news(db):
 
 def main():
     """Main seeding function"""
+    init_db()
     db = SessionLocal()
     try:
         print("Starting database seeding...")
@@ -0,0 +1,176 @@
+"""Bulk NDJSON import of programs, events and news articles.
+
+Each line of the input is one JSON object, validated with the same schema
+the admin endpoints use. Valid rows are written in chunks, with one
+``executemany`` per chunk and one transaction per chunk. Rows that carry an
+``id`` are upserted on it; rows without one are inserted. A row that fails
+validation, or that the database rejects, is reported with its line number
+and does not stop the rest of the import.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass, field
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.database.tables import Event, NewsArticle, Program, utcnow
+from src.app.schemas import EventImport, NewsArticleImport, ProgramImport
+
+IMPORT_CHUNK_SIZE = int(os.getenv("UYD_IMPORT_CHUNK_SIZE", "500"))
+MAX_IMPORT_CHUNK_SIZE = 5000
+
+# Failures beyond this are counted but not listed, so a bad file cannot
+# blow up the size of the report
+MAX_REPORTED_ERRORS = 1000
+
+# What the database or driver raises for a row it cannot store, such as an
+# integer outside SQLite's 64-bit range
+_WRITE_ERRORS = (SQLAlchemyError, OverflowError, ValueError)
+
+# Entity names used by the API -> (model, row schema)
+IMPORT_ENTITIES = {
+    "programs": (Program, ProgramImport),
+    "events": (Event, EventImport),
+    "news": (NewsArticle, NewsArticleImport),
+}
+
+
+@dataclass
+class ImportReport:
+    inserted: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def add_error(self, line: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": error})
+
+
+def _describe(err: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, e['loc']))}: {e['msg']}" if e["loc"] else e["msg"]
+        for e in err.errors(include_url=False)
+    )
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[tuple[int, bytes]]:
+    """Split a byte stream into ``(line number, line)``, skipping blank lines."""
+    buffer = b""
+    line_no = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield line_no, line
+    if buffer.strip():
+        yield line_no + 1, buffer
+
+
+async def _upsert(db: AsyncSession, model, rows: list[dict]) -> tuple[int, int]:
+    """Write ``rows`` without committing. Returns (inserted, updated)."""
+    new_rows = [
+        {key: value for key, value in row.items() if key != "id"}
+        for row in rows
+        if row["id"] is None
+    ]
+    keyed_rows = [row for row in rows if row["id"] is not None]
+    inserted = len(new_rows)
+    updated = 0
+
+    if new_rows:
+        await db.execute(insert(model), new_rows)
+
+    if keyed_rows:
+        seen = set(
+            await db.scalars(
+                select(model.id).where(model.id.in_({row["id"] for row in keyed_rows}))
+            )
+        )
+        for row in keyed_rows:
+            if row["id"] in seen:
+                updated += 1
+            else:
+                inserted += 1
+                seen.add(row["id"])
+
+        stmt = sqlite_insert(model)
+        columns = [name for name in keyed_rows[0] if name != "id"]
+        # ON CONFLICT DO UPDATE skips column onupdate hooks, so set updated_at
+        # here; created_at is left as it was
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[model.id],
+            set_={
+                **{name: stmt.excluded[name] for name in columns},
+                "updated_at": utcnow(),
+            },
+        )
+        await db.execute(stmt, keyed_rows)
+
+    return inserted, updated
+
+
+async def _write_chunk(
+    db: AsyncSession, model, chunk: list[tuple[int, dict]], report: ImportReport
+) -> None:
+    try:
+        inserted, updated = await _upsert(db, model, [row for _, row in chunk])
+        await db.commit()
+    except _WRITE_ERRORS:
+        await db.rollback()
+    else:
+        report.inserted += inserted
+        report.updated += updated
+        return
+
+    # Retry row by row so one bad row only costs itself
+    for line_no, row in chunk:
+        try:
+            inserted, updated = await _upsert(db, model, [row])
+            await db.commit()
+        except _WRITE_ERRORS as err:
+            await db.rollback()
+            report.add_error(line_no, str(getattr(err, "orig", None) or err))
+        else:
+            report.inserted += inserted
+            report.updated += updated
+
+
+async def import_ndjson(
+    db: AsyncSession,
+    entity: str,
+    chunks: AsyncIterable[bytes],
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+) -> ImportReport:
+    """Validate and upsert every NDJSON line in ``chunks`` into ``entity``.
+
+    ``chunks`` may split lines anywhere, as a streamed request body does.
+    """
+    model, schema = IMPORT_ENTITIES[entity]
+    report = ImportReport()
+    pending: list[tuple[int, dict]] = []
+
+    async for line_no, line in iter_lines(chunks):
+        try:
+            row = schema.model_validate_json(line)
+        except ValidationError as err:
+            report.add_error(line_no, _describe(err))
+            continue
+        pending.append((line_no, row.model_dump()))
+        if len(pending) >= chunk_size:
+            await _write_chunk(db, model, pending, report)
+            pending = []
+
+    if pending:
+        await _write_chunk(db, model, pending, report)
+    return report
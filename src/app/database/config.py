@@ -1,11 +1,133 @@
+import os
+from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import ContextVar
+
 from sqlalchemy import (
     create_engine,
+    event,
 )
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-DATABASE_URL = "sqlite:///./uyd.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Database settings, overridable through environment variables
+DATABASE_URL = os.getenv("UYD_DATABASE_URL", "sqlite:///./uyd.db")
+ASYNC_DATABASE_URL = os.getenv(
+    "UYD_ASYNC_DATABASE_URL",
+    DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1),
+)
+
+DB_POOL_SIZE = int(os.getenv("UYD_DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("UYD_DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("UYD_DB_POOL_TIMEOUT", "30"))
+
+SQLITE_JOURNAL_MODE = os.getenv("UYD_SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("UYD_SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("UYD_SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("UYD_SQLITE_CACHE_SIZE_KB", "16384"))
+SQLITE_MMAP_SIZE = int(os.getenv("UYD_SQLITE_MMAP_SIZE", str(128 * 1024 * 1024)))
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune every new SQLite connection.
+
+    WAL lets readers run alongside a writer (event registrations), and
+    ``synchronous=NORMAL`` is durable across application crashes in WAL mode
+    while skipping the fsync on every commit.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    # Negative cache_size is in KiB rather than pages
+    cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")
+    cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def create_db_engine(url: str, *, is_async: bool = False, **kwargs):
+    """Create a sync or async engine with the shared pool and SQLite tuning."""
+    db_url = make_url(url)
+    is_sqlite = db_url.get_backend_name() == "sqlite"
+    is_file_db = db_url.database not in (None, "", ":memory:")
+
+    if is_file_db:
+        kwargs.setdefault("pool_size", DB_POOL_SIZE)
+        kwargs.setdefault("max_overflow", DB_MAX_OVERFLOW)
+        kwargs.setdefault("pool_timeout", DB_POOL_TIMEOUT)
+    if is_sqlite and not is_async:
+        kwargs.setdefault("connect_args", {"check_same_thread": False})
+
+    if is_async:
+        db_engine = create_async_engine(url, **kwargs)
+        sync_engine = db_engine.sync_engine
+    else:
+        db_engine = create_engine(url, **kwargs)
+        sync_engine = db_engine
+
+    if is_sqlite:
+        event.listen(sync_engine, "connect", _set_sqlite_pragmas)
+    return db_engine
+
+
+# Engines are created by init_engines() at startup rather than on import, so
+# importing the app (a worker, a script, a test) never touches the database.
+# The sync engine is kept for scripts (seed_data.py) and migrations; request
+# handlers use the async one so database I/O never blocks the event loop.
+_engine = None
+_async_engine = None
+
+SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+AsyncSessionLocal = async_sessionmaker(
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+def init_engines() -> None:
+    """Create both engines and bind the session factories to them.
+
+    Safe to call more than once; later calls are no-ops.
+    """
+    global _engine, _async_engine
+    if _engine is None:
+        _engine = create_db_engine(DATABASE_URL)
+        SessionLocal.configure(bind=_engine)
+    if _async_engine is None:
+        _async_engine = create_db_engine(ASYNC_DATABASE_URL, is_async=True)
+        AsyncSessionLocal.configure(bind=_async_engine)
+
+
+def get_engine():
+    init_engines()
+    return _engine
+
+
+def get_async_engine():
+    init_engines()
+    return _async_engine
+
+
+async def open_pool(connections: int = DB_POOL_SIZE) -> None:
+    """Open ``connections`` pooled connections ahead of the first request.
+
+    Each one runs the SQLite pragmas on connect and goes back to the pool,
+    so early requests do not pay for opening a connection.
+    """
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            connection = await stack.enter_async_context(get_async_engine().connect())
+            await connection.exec_driver_sql("SELECT 1")
+
+
+async def dispose_engines() -> None:
+    """Close every pooled connection; the engines reconnect if used again."""
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    if _engine is not None:
+        _engine.dispose()
 
 
 # Dependency to get database session
@@ -15,3 +137,34 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Set while /api/batch runs its sub-requests, so they share one session
+shared_session: ContextVar[AsyncSession | None] = ContextVar(
+    "shared_session", default=None
+)
+
+
+@asynccontextmanager
+async def snapshot_session():
+    """An async session whose reads all see the same database snapshot.
+
+    pysqlite only opens a transaction before writes, so without an explicit
+    BEGIN every SELECT would see the latest commit. In WAL mode the read
+    transaction started here pins the snapshot until the session closes.
+    """
+    async with AsyncSessionLocal() as db:
+        connection = await db.connection()
+        if connection.dialect.name == "sqlite":
+            await connection.exec_driver_sql("BEGIN")
+        yield db
+
+
+# Dependency to get an async database session
+async def get_async_db():
+    db = shared_session.get()
+    if db is not None:
+        yield db
+        return
+    async with AsyncSessionLocal() as db:
+        yield db
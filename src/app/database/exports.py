@@ -0,0 +1,120 @@
+"""Streaming CSV and NDJSON export of event registrations.
+
+Rows are read with a server-side cursor in ``EXPORT_BATCH_SIZE`` batches
+and encoded one batch at a time, so memory use does not grow with the
+number of registrations exported.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+from collections.abc import AsyncIterator
+from datetime import datetime
+
+from sqlalchemy import select
+
+from src.app.database.config import AsyncSessionLocal
+from src.app.database.tables import Event, EventRegistration
+
+EXPORT_BATCH_SIZE = int(os.getenv("UYD_EXPORT_BATCH_SIZE", "1000"))
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+_COLUMNS = (
+    EventRegistration.id,
+    EventRegistration.event_id,
+    Event.title.label("event_title"),
+    EventRegistration.user_name,
+    EventRegistration.user_email,
+    EventRegistration.user_mobile_number,
+    EventRegistration.registration_date,
+    EventRegistration.is_confirmed,
+    EventRegistration.is_waitlisted,
+)
+EXPORT_FIELDS = tuple(column.key for column in _COLUMNS)
+
+
+def _registrations_query(
+    event_id: int | None,
+    confirmed: bool | None,
+    registered_from: datetime | None,
+    registered_to: datetime | None,
+):
+    query = select(*_COLUMNS).join(Event, Event.id == EventRegistration.event_id)
+    if event_id is not None:
+        query = query.where(EventRegistration.event_id == event_id)
+    if confirmed is not None:
+        query = query.where(EventRegistration.is_confirmed == confirmed)
+    if registered_from is not None:
+        query = query.where(EventRegistration.registration_date >= registered_from)
+    if registered_to is not None:
+        query = query.where(EventRegistration.registration_date < registered_to)
+    return query.order_by(EventRegistration.id)
+
+
+# Leading characters that make a spreadsheet treat a cell as a formula
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    # Names and titles are user input; quote would-be formulas (OWASP CSV
+    # injection) so they open as text
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _encode_csv(rows, header: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        writer.writerow(_csv_value(value) for value in row)
+    return buffer.getvalue()
+
+
+def _encode_ndjson(rows) -> str:
+    return "".join(
+        json.dumps(
+            {
+                field: value.isoformat() if isinstance(value, datetime) else value
+                for field, value in zip(EXPORT_FIELDS, row, strict=True)
+            }
+        )
+        + "\n"
+        for row in rows
+    )
+
+
+async def export_registrations(
+    export_format: str,
+    event_id: int | None = None,
+    confirmed: bool | None = None,
+    registered_from: datetime | None = None,
+    registered_to: datetime | None = None,
+) -> AsyncIterator[str]:
+    """Yield registrations as CSV or NDJSON text, one batch per chunk.
+
+    Opens its own session, because a ``StreamingResponse`` keeps reading
+    after the request's dependencies have been closed.
+    """
+    query = _registrations_query(event_id, confirmed, registered_from, registered_to)
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        if export_format == "csv":
+            # The header is sent even when nothing matches
+            yield _encode_csv((), header=True)
+        async for rows in result.partitions():
+            if export_format == "csv":
+                yield _encode_csv(rows, header=False)
+            else:
+                yield _encode_ndjson(rows)
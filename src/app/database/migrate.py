@@ -0,0 +1,72 @@
+"""Alembic schema migrations."""
+
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect
+
+from src.app.database.config import get_engine
+from src.app.database.search import SEARCH_TABLES
+from src.app.database.stats import STATS_TABLE
+
+ALEMBIC_INI = Path(__file__).resolve().parents[3] / "alembic.ini"
+
+
+def get_alembic_config() -> Config:
+    config = Config(str(ALEMBIC_INI))
+    # Leave logging to the application
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def upgrade_database(revision: str = "head") -> None:
+    """Apply pending migrations to the app database."""
+    config = get_alembic_config()
+    with get_engine().begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, revision)
+
+
+def init_db() -> None:
+    """Bring the schema up to date.
+
+    Run once before the server starts (``python migrate_db.py``), not from
+    every worker: concurrent upgrades of one database race each other.
+    """
+    upgrade_database()
+
+
+def _raw_sql_tables() -> set[str]:
+    """Tables the migrations create with raw SQL, outside the models."""
+    return {STATS_TABLE, *(f"{table}_fts" for table in SEARCH_TABLES)}
+
+
+def check_schema() -> None:
+    """Fail startup unless the database is at the latest migration.
+
+    Also checks for the search indexes and stats counters, which autogenerate
+    does not track, so a database whose tables were dropped or rebuilt by
+    hand does not start with search or stats failing.
+    """
+    config = get_alembic_config()
+    heads = set(ScriptDirectory.from_config(config).get_heads())
+    with get_engine().connect() as connection:
+        current = set(MigrationContext.configure(connection).get_current_heads())
+        if connection.dialect.name == "sqlite":
+            missing = _raw_sql_tables() - set(inspect(connection).get_table_names())
+        else:
+            missing = set()
+    if current != heads:
+        raise RuntimeError(
+            f"Database schema is at {', '.join(sorted(current)) or 'no revision'} "
+            f"but the code expects {', '.join(sorted(heads))}; "
+            "run `python migrate_db.py` first"
+        )
+    if missing:
+        raise RuntimeError(
+            f"Database is missing {', '.join(sorted(missing))}, "
+            "which migrations 0005 and 0006 create"
+        )
@@ -0,0 +1,194 @@
+"""Event registration writes, batched through a single writer.
+
+Every signup used to commit its own transaction, so a popular event opening
+meant one SQLite write-lock acquisition and commit per request, with
+callers queueing on ``busy_timeout`` and eventually failing with "database
+is locked". ``RegistrationWriter`` instead collects pending signups and
+writes them in one transaction, every ``REGISTRATION_BATCH_MS``
+milliseconds or ``REGISTRATION_BATCH_SIZE`` rows, whichever comes first.
+
+Each row is written with statements that cannot fail the transaction: an
+``INSERT ... ON CONFLICT DO NOTHING`` detects a duplicate, and a
+conditional ``UPDATE`` of ``registered_count`` claims the seat while the
+event has room and its registration deadline has not passed. So one
+duplicate, full or closed event never rolls back the rest of the batch, and
+every caller still gets its own outcome.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.database.config import AsyncSessionLocal
+from src.app.database.tables import Event, EventRegistration, utcnow
+
+logger = logging.getLogger(__name__)
+
+GROUP_COMMIT = os.getenv("UYD_REGISTRATION_GROUP_COMMIT", "1") == "1"
+REGISTRATION_BATCH_MS = float(os.getenv("UYD_REGISTRATION_BATCH_MS", "5"))
+REGISTRATION_BATCH_SIZE = int(os.getenv("UYD_REGISTRATION_BATCH_SIZE", "200"))
+
+# Outcomes of a single registration
+REGISTERED = "registered"
+WAITLISTED = "waitlisted"
+DUPLICATE = "duplicate"
+FULL = "full"
+CLOSED = "closed"
+
+
+async def write_registration(db: AsyncSession, registration) -> str:
+    """Write one registration in the current transaction, without committing.
+
+    ``registration`` is an ``EventRegistrationSchema`` for an event that is
+    known to exist. Returns one of the outcome constants. Nothing is left
+    behind for a duplicate, a full event or one whose deadline has passed.
+    """
+    now = utcnow()
+    registration_id = await db.scalar(
+        insert(EventRegistration)
+        .values(
+            event_id=registration.event_id,
+            user_name=registration.user_name,
+            user_email=registration.user_email,
+            user_mobile_number=registration.user_mobile_number,
+            is_waitlisted=False,
+        )
+        # Either unique index (email or mobile per event) counts as a duplicate
+        .on_conflict_do_nothing()
+        .returning(EventRegistration.id)
+    )
+    if registration_id is None:
+        return DUPLICATE
+
+    seat = await db.execute(
+        update(Event)
+        .where(
+            Event.id == registration.event_id,
+            or_(
+                Event.max_participants.is_(None),
+                Event.registered_count < Event.max_participants,
+            ),
+            or_(
+                Event.registration_deadline.is_(None),
+                Event.registration_deadline >= now,
+            ),
+        )
+        # Taking a seat is not a content change, so keep updated_at and ETags
+        .values(
+            registered_count=Event.registered_count + 1,
+            updated_at=Event.updated_at,
+        )
+    )
+    if seat.rowcount:
+        return REGISTERED
+
+    # No seat: tell a closed event from a full one, which may have a waitlist
+    closed = await db.scalar(
+        select(Event.id).where(
+            Event.id == registration.event_id, Event.registration_deadline < now
+        )
+    )
+    if closed is None and registration.waitlist:
+        await db.execute(
+            update(EventRegistration)
+            .where(EventRegistration.id == registration_id)
+            .values(is_waitlisted=True)
+        )
+        return WAITLISTED
+    await db.execute(
+        delete(EventRegistration).where(EventRegistration.id == registration_id)
+    )
+    return FULL if closed is None else CLOSED
+
+
+class RegistrationWriter:
+    """Single writer task that group-commits queued registrations.
+
+    The task is started on first use in the running event loop, and
+    restarted if the loop changes, so it works under the server as well as
+    under test clients that run each test in a fresh loop.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = GROUP_COMMIT,
+        max_delay: float = REGISTRATION_BATCH_MS / 1000,
+        max_batch: int = REGISTRATION_BATCH_SIZE,
+    ):
+        self.enabled = enabled
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+
+    async def submit(self, registration) -> str:
+        """Queue ``registration`` and wait for the batch holding it to commit."""
+        self._ensure_started()
+        future = self._loop.create_future()
+        self._queue.put_nowait((registration, future))
+        return await future
+
+    async def stop(self) -> None:
+        """Stop the writer task. Call once no more requests are served."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = self._queue = self._loop = None
+
+    async def _next_batch(self) -> list:
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_delay
+        while len(batch) < self.max_batch:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            # Before Python 3.11 this is not the builtin TimeoutError
+            except asyncio.TimeoutError:  # noqa: UP041
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                async with AsyncSessionLocal() as db:
+                    outcomes = [
+                        await write_registration(db, registration)
+                        for registration, _ in batch
+                    ]
+                    await db.commit()
+            except Exception as err:
+                logger.exception("Registration batch of %d failed", len(batch))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(err)
+                continue
+            for (_, future), outcome in zip(batch, outcomes, strict=True):
+                # A caller that disconnected has cancelled its future
+                if not future.done():
+                    future.set_result(outcome)
+
+
+registration_writer = RegistrationWriter()
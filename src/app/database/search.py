@@ -0,0 +1,100 @@
+"""SQLite FTS5 full-text search over events, news articles and programs.
+
+Each searchable table gets an external-content FTS5 index (``<table>_fts``)
+that stores only the inverted index and reads column values back from the
+base table. Triggers keep the index in step with every insert, update and
+delete, whichever engine or script performs the write. Migration 0006
+creates the indexes and triggers.
+"""
+
+import html
+import re
+
+from sqlalchemy import Integer, column, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# table -> indexed columns, in bm25 weight order (as in migration 0006)
+SEARCH_TABLES = {
+    "events": ("title", "description", "content"),
+    "news_articles": ("title", "excerpt", "content"),
+    "programs": ("title", "description", "content"),
+}
+
+# Entity names used by the API, mapped to their base tables
+SEARCH_ENTITIES = {
+    "events": "events",
+    "news": "news_articles",
+    "programs": "programs",
+}
+
+# A title hit outweighs a summary hit, which outweighs a body hit
+_BM25_WEIGHTS = (10.0, 4.0, 1.0)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Private-use characters FTS5 puts around matches in snippets; they are
+# swapped for <mark> tags only after the stored text has been escaped
+_MARK_START = "\ue000"
+_MARK_END = "\ue001"
+
+
+def _highlight(snippet: str) -> str:
+    """HTML-escape a snippet, then mark its matches with ``<mark>`` tags."""
+    escaped = html.escape(snippet, quote=False)
+    return escaped.replace(_MARK_START, "<mark>").replace(_MARK_END, "</mark>")
+
+
+def build_match_query(term: str) -> str | None:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Every word is quoted so FTS5 operators in user input are treated as
+    text, and the last word is a prefix match so results update while the
+    user is still typing.
+    """
+    tokens = _TOKEN_RE.findall(term)
+    if not tokens:
+        return None
+    quoted = [f'"{token}"' for token in tokens]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def matching_ids(table: str):
+    """``SELECT rowid`` of ``table`` rows matching the ``:match`` parameter."""
+    fts = f"{table}_fts"
+    return text(f"SELECT rowid FROM {fts} WHERE {fts} MATCH :match").columns(
+        column("rowid", Integer)
+    )
+
+
+def _entity_search_sql(entity: str) -> str:
+    table = SEARCH_ENTITIES[entity]
+    fts = f"{table}_fts"
+    weights = ", ".join(str(w) for w in _BM25_WEIGHTS)
+    return (
+        f"SELECT '{entity}' AS type, t.id AS id, t.title AS title, "
+        f"snippet({fts}, -1, '{_MARK_START}', '{_MARK_END}', '…', 16) AS snippet, "
+        f"bm25({fts}, {weights}) AS score "
+        f"FROM {fts} JOIN {table} AS t ON t.id = {fts}.rowid "
+        f"WHERE {fts} MATCH :match AND t.is_active = 1"
+    )
+
+
+async def search(
+    db: AsyncSession, term: str, entities: list[str], limit: int
+) -> list[dict]:
+    """BM25-ranked matches across ``entities`` with highlighted snippets.
+
+    Snippets are safe to insert as HTML: the stored text is escaped and the
+    only markup is the ``<mark>`` around each match.
+    """
+    match = build_match_query(term)
+    if match is None:
+        return []
+
+    statement = text(
+        " UNION ALL ".join(_entity_search_sql(e) for e in entities)
+        + " ORDER BY score LIMIT :limit"
+    )
+    result = await db.execute(statement, {"match": match, "limit": limit})
+    return [{**row, "snippet": _highlight(row["snippet"])} for row in result.mappings()]
@@ -0,0 +1,43 @@
+"""Site-wide counters for ``/api/core/stats``, maintained by SQLite triggers.
+
+``site_stats`` holds one row per counter. Triggers on the counted tables
+adjust it in the same transaction as every insert, delete and flag change
+(``is_active``, ``is_waitlisted``), whichever engine or script performs the
+write, so reading the stats is a primary-key lookup instead of a
+``COUNT(*)`` over each table. The table, its triggers and the one-time
+backfill are migration 0005. SQLite drops a table's triggers when a batch
+migration recreates it, so a later migration that rebuilds a counted table
+has to recreate its triggers.
+"""
+
+from sqlalchemy import bindparam, func, select, text, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.database.tables import Event, utcnow
+
+STATS_TABLE = "site_stats"
+
+# Counters kept by the triggers; registrations leaves out the waitlist
+STAT_COUNTERS = ("programs", "events", "news", "registrations")
+
+
+_READ_COUNTERS = text(
+    f"SELECT name, value FROM {STATS_TABLE} WHERE name IN :names"
+).bindparams(bindparam("names", value=list(STAT_COUNTERS), expanding=True))
+
+
+async def read_site_stats(db: AsyncSession) -> dict[str, int]:
+    """Every counter, plus the number of upcoming events.
+
+    Upcoming events change with the clock rather than with writes, so they
+    are counted on the ``(is_active, start_date)`` index, which only visits
+    the upcoming rows.
+    """
+    counters = dict.fromkeys(STAT_COUNTERS, 0)
+    counters.update((await db.execute(_READ_COUNTERS)).all())
+    counters["upcoming_events"] = await db.scalar(
+        select(func.count())
+        .select_from(Event)
+        .where(Event.is_active == true(), Event.start_date >= utcnow())
+    )
+    return counters
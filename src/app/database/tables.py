@@ -1,16 +1,41 @@
-from datetime import datetime
-
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.ext.declarative import declarative_base
 
-from src.app.database.config import engine
-
 Base = declarative_base()
 
 
+def utcnow() -> datetime:
+    """The current UTC time as a naive datetime, like every stored timestamp."""
+    # datetime.UTC would need Python 3.11
+    return datetime.now(timezone.utc).replace(tzinfo=None)  # noqa: UP017
+
+
 # Database Models
 class Program(Base):
     __tablename__ = "programs"
+    __table_args__ = (
+        # Composite and partial indexes are created by migrations/versions/0002
+        Index("ix_programs_is_active", "is_active"),
+        Index("ix_programs_active_category", "is_active", "category"),
+        Index(
+            "ix_programs_featured", "is_featured", sqlite_where=text("is_active = 1")
+        ),
+        Index("ix_programs_updated_at", "updated_at"),
+        Index("ix_programs_featured_image", "featured_image"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
@@ -21,14 +46,24 @@ class Program(Base):
     )  # education, agribusiness, leadership, environment, tourism, lifeskills
     content = Column(Text)
     featured_image = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
     is_featured = Column(Boolean, default=False)
     is_active = Column(Boolean, default=True)
 
+    # Not a column; set by attach_image_variants() when the rows are served
+    featured_image_variants = None
+
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_active_start", "is_active", "start_date"),
+        Index("ix_events_active_type_start", "is_active", "event_type", "start_date"),
+        Index("ix_events_active_end_type", "is_active", "end_date", "event_type"),
+        Index("ix_events_updated_at", "updated_at"),
+        Index("ix_events_featured_image", "featured_image"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
@@ -44,14 +79,36 @@ class Event(Base):
     featured_image = Column(String, nullable=True)
     content = Column(Text, nullable=True)
     registration_deadline = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Confirmed seats taken, kept in step by register_for_event
+    registered_count = Column(Integer, default=0, server_default=text("0"))
+    created_at = Column(DateTime, default=utcnow)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
     is_featured = Column(Boolean, default=False)
     is_active = Column(Boolean, default=True)
 
+    # Not a column; set by attach_image_variants() when the rows are served
+    featured_image_variants = None
+
 
 class NewsArticle(Base):
     __tablename__ = "news_articles"
+    __table_args__ = (
+        Index("ix_news_articles_active_publish", "is_active", "publish_date"),
+        Index(
+            "ix_news_articles_active_featured_publish",
+            "is_active",
+            "is_featured",
+            "publish_date",
+        ),
+        Index(
+            "ix_news_articles_active_category_publish",
+            "is_active",
+            "category",
+            "publish_date",
+        ),
+        Index("ix_news_articles_updated_at", "updated_at"),
+        Index("ix_news_articles_featured_image", "featured_image"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
@@ -59,27 +116,52 @@ class NewsArticle(Base):
     excerpt = Column(String(500), nullable=True)
     category = Column(String, index=True)
     author = Column(String)
-    publish_date = Column(DateTime, default=datetime.utcnow)
+    publish_date = Column(DateTime, default=utcnow)
     featured_image = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=utcnow)
+    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
     is_featured = Column(Boolean, default=False)
     is_active = Column(Boolean, default=True)
 
+    # Not a column; set by attach_image_variants() when the rows are served
+    featured_image_variants = None
+
 
 # Event registration
 class EventRegistration(Base):
     """Event Registration."""
 
     __tablename__ = "event_registrations"
+    __table_args__ = (
+        # One registration per person and event, enforced by the database
+        Index(
+            "uq_event_registrations_event_email", "event_id", "user_email", unique=True
+        ),
+        Index(
+            "uq_event_registrations_event_mobile",
+            "event_id",
+            "user_mobile_number",
+            unique=True,
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     event_id = Column(Integer, ForeignKey("events.id"))
     user_name = Column(String, index=True)
     user_email = Column(String, index=True)
     user_mobile_number = Column(String, index=True)
-    registration_date = Column(DateTime, default=datetime.utcnow)
+    registration_date = Column(DateTime, default=utcnow)
     is_confirmed = Column(Boolean, default=False)
+    is_waitlisted = Column(Boolean, default=False, server_default=text("0"))
+
+
+class Image(Base):
+    """Dimensions and resized variants of an uploaded image."""
 
+    __tablename__ = "images"
 
-Base.metadata.create_all(bind=engine)
+    path = Column(String, primary_key=True)  # as stored in featured_image
+    width = Column(Integer)
+    height = Column(Integer)
+    srcset = Column(JSON)  # MIME type -> "url 320w, url 640w, ..."
+    created_at = Column(DateTime, default=utcnow)
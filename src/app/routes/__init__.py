@@ -3,30 +3,92 @@
 Provides REST API for programs, events, and other content management
 """
 
+import logging
+import os
+import time
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 
+from src.app.database.config import dispose_engines, init_engines, open_pool
+from src.app.database.migrate import check_schema
+from src.app.database.registrations import registration_writer
 from src.app.routes.api import router as api_router
+from src.app.routes.pages import load_templates, warm_static_pages
 from src.app.routes.pages import router as pages_router
+from src.app.utils.assets import AssetFiles, load_manifest
+from src.app.utils.batch import dispatch_get
+from src.app.utils.image_variants import shutdown_image_pool
+
+logger = logging.getLogger(__name__)
 
 base_dir = Path(__file__).parent.parent.parent
 
+# Served once at startup to fill the response, fragment and count caches
+WARM_PATHS = tuple(
+    path.strip()
+    for path in os.getenv(
+        "UYD_WARM_PATHS", "/api/core/home,/news.html,/programs.html"
+    ).split(",")
+    if path.strip()
+)
+
+
+async def prime_caches(app: FastAPI) -> None:
+    """Serve every ``WARM_PATHS`` request in-process and drop the responses."""
+    for path in WARM_PATHS:
+        result = await dispatch_get(app, {"headers": []}, path)
+        if result["status"] >= 400:
+            logger.warning("Warm-up GET %s returned %d", path, result["status"])
+
+
+@contextmanager
+def _startup_step(name: str):
+    started = time.perf_counter()
+    yield
+    elapsed = (time.perf_counter() - started) * 1000
+    logger.info("Startup: %s took %.1f ms", name, elapsed)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Nothing below runs on import; each worker does it once, in this order
+    with _startup_step("create engines"):
+        init_engines()
+    # Migrations run once before the workers start (migrate_db.py)
+    with _startup_step("check schema"):
+        check_schema()
+    with _startup_step("open pool"):
+        await open_pool()
+    with _startup_step("load templates"):
+        load_manifest()
+        load_templates()
+    with _startup_step("prerender pages"):
+        warm_static_pages()
+    with _startup_step("prime caches"):
+        await prime_caches(app)
+    yield
+    await registration_writer.stop()
+    shutdown_image_pool()
+    await dispose_engines()
+
+
 # FastAPI app
 app = FastAPI(
     title="United Youth Developers API",
     description="Backend API for UYD website content management",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
-# Mount static files
+# Mount static files, preferring fingerprinted build output
 app.mount(
     "/assets",
-    StaticFiles(directory=str(base_dir / "assets")),
+    AssetFiles(directory=str(base_dir / "assets")),
     name="assets",
 )
 
@@ -37,6 +99,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified", "X-Next-Cursor"],
 )
 
 
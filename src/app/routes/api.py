@@ -4,37 +4,336 @@ from datetime import datetime
 from pathlib import Path
 from typing import Literal
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy import or_
-
-from src.app.database.config import get_db
-from src.app.database.tables import Event, EventRegistration, NewsArticle, Program
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select, true, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.database.bulk_import import (
+    IMPORT_CHUNK_SIZE,
+    MAX_IMPORT_CHUNK_SIZE,
+    import_ndjson,
+)
+from src.app.database.config import get_async_db, shared_session, snapshot_session
+from src.app.database.exports import EXPORT_MEDIA_TYPES, export_registrations
+from src.app.database.registrations import (
+    CLOSED,
+    DUPLICATE,
+    FULL,
+    WAITLISTED,
+    registration_writer,
+    write_registration,
+)
+from src.app.database.search import SEARCH_ENTITIES, search
+from src.app.database.stats import read_site_stats
+from src.app.database.tables import Event, NewsArticle, Program, utcnow
 from src.app.schemas import (
+    BatchRequest,
+    BatchResult,
+    EventListItem,
     EventRegistrationSchema,
     EventResponse,
+    ImportResult,
     NewsArticleCreate,
+    NewsArticleListItem,
     NewsArticleResponse,
+    NotFoundItem,
+    ProgramListItem,
     ProgramResponse,
+    SearchResult,
 )
 from src.app.utils.api_security import verify_api_key
+from src.app.utils.batch import BATCH_MAX_REQUESTS, batch_path_error, dispatch_get
+from src.app.utils.http_cache import http_date, is_not_modified, make_etag
 from src.app.utils.image_upload import get_upload_directory, save_upload_file
+from src.app.utils.image_variants import (
+    attach_image_variants,
+    load_image_variants,
+    process_image,
+)
+from src.app.utils.pagination import (
+    MAX_PAGE_SIZE,
+    clamp_limit,
+    decode_cursor,
+    encode_cursor,
+)
+from src.app.utils.response_cache import response_cache
+from src.app.utils.serialization import dump_json, response_columns, rows_to_dicts
+from src.app.utils.upload_store import release_upload
 
 base_dir = Path(__file__).parent.parent
 
-# Database setup
-DATABASE_URL = "sqlite:///./uyd.db"
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
-
 router = APIRouter()
 
+# Shared dependency and parameter defaults, declared once rather than as a
+# call in every signature
+_DB = Depends(get_async_db)
+_API_KEY = Depends(verify_api_key)
+_IMAGE_FILE = File(None)
+
+# Shared list pagination parameters
+_SKIP_QUERY = Query(
+    0,
+    ge=0,
+    deprecated=True,
+    description="Offset paging, kept for compatibility. Use `cursor` instead.",
+)
+_LIMIT_QUERY = Query(
+    MAX_PAGE_SIZE,
+    ge=1,
+    description=f"Page size, capped at {MAX_PAGE_SIZE}.",
+)
+_CURSOR_QUERY = Query(
+    None,
+    description="Opaque `X-Next-Cursor` value from the previous page.",
+)
+
+# List endpoints select these columns rather than ORM entities and encode
+# the row tuples directly (see utils/serialization.py)
+_PROGRAM_COLUMNS = response_columns(Program, ProgramResponse)
+_EVENT_COLUMNS = response_columns(Event, EventResponse)
+_NEWS_COLUMNS = response_columns(NewsArticle, NewsArticleResponse)
+
+_FIELDS_QUERY = Query(
+    None,
+    description="Comma-separated fields to return, or `*` for all of them. "
+    "Defaults to every field except `content`.",
+)
+
+# Large text left out of list responses unless requested with ``fields=``;
+# the single-item endpoints always return it
+_SUMMARY_EXCLUDED = frozenset({"content"})
+
+
+def _list_fields(fields: str | None, schema) -> tuple[str, ...]:
+    """Response fields selected by ``fields=``, in the response model's order."""
+    available = tuple(schema.model_fields)
+    if fields is None:
+        return tuple(name for name in available if name not in _SUMMARY_EXCLUDED)
+    if fields.strip() == "*":
+        return available
+    requested = {name.strip() for name in fields.split(",")} - {""}
+    unknown = requested.difference(available)
+    if unknown or not requested:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+            if unknown
+            else "No fields requested",
+        )
+    return tuple(name for name in available if name in requested)
+
+
+_IDS_QUERY = Query(
+    None,
+    description="Comma-separated ids to fetch, e.g. `1,5,9`. Items come back in "
+    "this order, with a 404 marker for each id that was not found. Paging "
+    "parameters are ignored.",
+)
+
+
+def _parse_ids(ids: str | None) -> tuple[int, ...] | None:
+    if ids is None:
+        return None
+    try:
+        wanted = tuple(int(part) for part in ids.split(",") if part.strip())
+    except ValueError as err:
+        raise HTTPException(
+            status_code=400, detail="ids must be comma-separated integers"
+        ) from err
+    if not wanted or len(wanted) > MAX_PAGE_SIZE:
+        raise HTTPException(
+            status_code=400, detail=f"Pass between 1 and {MAX_PAGE_SIZE} ids"
+        )
+    return wanted
+
+
+def _not_found_marker(item_id: int) -> dict:
+    return {"id": item_id, "status": 404, "detail": "Not found"}
+
+
+def _field_columns(columns, fields, *sort_keys) -> tuple:
+    """The columns ``fields`` and the page's ``sort_keys`` need, nothing more.
+
+    Unrequested columns are left out of the SELECT, so they are neither read
+    from SQLite nor encoded.
+    """
+    names = {*fields, *(column.key for column in sort_keys)}
+    if "featured_image_variants" in names:
+        names.add("featured_image")
+    return tuple(column for column in columns if column.key in names)
+
+
+_ENTITY_MODELS = {"programs": Program, "events": Event, "news": NewsArticle}
+
+
+async def _entity_version(db: AsyncSession, entities, extra=()) -> tuple:
+    """Return ``(max(updated_at), count)`` per entity plus ``extra`` in one query.
+
+    This is all a conditional GET needs to answer with 304, so no rows are
+    loaded for clients whose copy is still current.
+    """
+    columns = []
+    for entity in entities:
+        model = _ENTITY_MODELS[entity]
+        columns.append(select(func.max(model.updated_at)).scalar_subquery())
+        columns.append(select(func.count(model.id)).scalar_subquery())
+    row = (await db.execute(select(*columns, *extra))).one()
+    return tuple(row)
+
+
+async def _list_items(db: AsyncSession, rows, fields=None, ids=None) -> list[dict]:
+    """Response items for list ``rows``, with image variants when requested."""
+    items = rows_to_dicts(rows)
+    if fields is None or "featured_image_variants" in fields:
+        variants = await load_image_variants(
+            db, (item["featured_image"] for item in items)
+        )
+        for item in items:
+            item["featured_image_variants"] = variants.get(item["featured_image"])
+    item_ids = [item["id"] for item in items] if ids is not None else None
+    if fields is not None:
+        items = [{name: item[name] for name in fields} for item in items]
+    if ids is not None:
+        found = dict(zip(item_ids, items, strict=True))
+        items = [found.get(item_id) or _not_found_marker(item_id) for item_id in ids]
+    return items
+
+
+async def _cached_json(
+    request: Request,
+    db: AsyncSession,
+    key,
+    entities,
+    load,
+    version_extra=(),
+    next_cursor=None,
+    fields=None,
+    ids=None,
+    until_next_start=False,
+) -> Response:
+    """Serve ``key`` with ETag / Last-Modified, from the response cache if possible.
+
+    ``load`` returns row tuples and is only awaited on a cache miss whose
+    validators do not match the client's copy, so cache hits and 304s skip
+    the row query and JSON encoding entirely. ``next_cursor`` maps the loaded
+    rows to the ``X-Next-Cursor`` header of paginated lists. ``fields``
+    limits the keys of each item; by default every loaded column is sent.
+    With ``ids``, the items are put in that order and ids without a row get
+    a 404 marker; ``load`` must then select the ``id`` column.
+
+    Lists of upcoming events pass ``until_next_start``: they change when the
+    next event starts, not only on writes, so that start is part of the ETag
+    and the cached body expires then.
+    """
+    cached = response_cache.get(key)
+    if cached is None:
+        generation = response_cache.generation(entities)
+        if until_next_start:
+            version_extra = (*version_extra, _next_event_start())
+        version = await _entity_version(db, entities, version_extra)
+        etag = make_etag(key, version)
+        last_modified = max(
+            (v for v in version[: len(entities) * 2 : 2] if v is not None),
+            default=None,
+        )
+        if is_not_modified(request, etag, last_modified):
+            return _not_modified(etag, last_modified)
+        rows = await load()
+        body = dump_json(await _list_items(db, rows, fields, ids))
+        headers = {}
+        if next_cursor is not None and (cursor := next_cursor(rows)):
+            headers["X-Next-Cursor"] = cursor
+        cached = (body, etag, last_modified, headers)
+        ttl = _seconds_until(version[-1]) if until_next_start else None
+        response_cache.set(key, cached, entities, generation, ttl=ttl)
+
+    body, etag, last_modified, headers = cached
+    if is_not_modified(request, etag, last_modified):
+        return _not_modified(etag, last_modified)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={**_validator_headers(etag, last_modified), **headers},
+    )
+
+
+def _page_cursor(limit: int, sort_key):
+    """Cursor for the page after ``rows`` when the page came back full."""
+
+    def next_cursor(rows):
+        if len(rows) < limit:
+            return None
+        return encode_cursor(*sort_key(rows[-1]))
+
+    return next_cursor
+
+
+def _next_event_start():
+    """Start of the next upcoming event, which is when upcoming lists change."""
+    return (
+        select(func.min(Event.start_date))
+        .where(Event.is_active == true(), Event.start_date >= utcnow())
+        .scalar_subquery()
+    )
+
+
+def _seconds_until(moment: datetime | None) -> float | None:
+    """Cache lifetime of a value that changes at ``moment`` (None: never)."""
+    if moment is None:
+        return None
+    return max((moment - utcnow()).total_seconds(), 0.0)
+
+
+def _featured_programs_query(columns):
+    return select(*columns).where(
+        Program.is_active == true(), Program.is_featured == true()
+    )
+
+
+def _upcoming_events_query(columns):
+    return (
+        select(*columns)
+        .where(Event.is_active == true(), Event.start_date >= utcnow())
+        .order_by(Event.start_date)
+        .limit(10)
+    )
+
+
+def _latest_news_query(columns):
+    return (
+        select(*columns)
+        .where(NewsArticle.is_active == true())
+        .order_by(NewsArticle.publish_date.desc())
+        .limit(10)
+    )
+
+
+def _validator_headers(etag: str, last_modified: datetime | None) -> dict:
+    # no-cache lets browsers keep the body but revalidate it on every use
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def _not_modified(etag: str, last_modified: datetime | None) -> Response:
+    return Response(status_code=304, headers=_validator_headers(etag, last_modified))
+
 
 @router.post("/api/programs")
 async def create_program(
+    background_tasks: BackgroundTasks,
     title: str,
     description: str,
     content: str,
@@ -42,9 +341,9 @@ async def create_program(
     category: Literal[
         "Leadership", "Agriculture", "Digital Skill", "Environment"
     ] = "Others",
-    featured_image_file: UploadFile | None = File(None),
-    db: Session = Depends(get_db),
-    _: None = Depends(verify_api_key),
+    featured_image_file: UploadFile | None = _IMAGE_FILE,
+    db: AsyncSession = _DB,
+    _: None = _API_KEY,
 ) -> ProgramResponse:
     """Create a new program with optional image upload."""
     # Handle image upload if provided
@@ -52,6 +351,7 @@ async def create_program(
     if featured_image_file:
         upload_dir = get_upload_directory()
         featured_image_path = await save_upload_file(featured_image_file, upload_dir)
+        background_tasks.add_task(process_image, featured_image_path)
 
     # Create program data
     program_data = {
@@ -65,68 +365,126 @@ async def create_program(
 
     db_program = Program(**program_data)
     db.add(db_program)
-    db.commit()
-    db.refresh(db_program)
+    await db.commit()
+    response_cache.invalidate("programs")
+    await db.refresh(db_program)
     return db_program
 
 
-@router.get("/api/programs", response_model=list[ProgramResponse])
+@router.get("/api/programs", response_model=list[ProgramListItem | NotFoundItem])
 async def get_programs(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    skip: int = _SKIP_QUERY,
+    limit: int = _LIMIT_QUERY,
+    cursor: str | None = _CURSOR_QUERY,
     category: str | None = None,
     featured: bool | None = None,
-    db: Session = Depends(get_db),
+    fields: str | None = _FIELDS_QUERY,
+    ids: str | None = _IDS_QUERY,
+    db: AsyncSession = _DB,
 ):
-    query = db.query(Program).filter(Program.is_active)
+    limit = clamp_limit(limit)
+    after = decode_cursor(cursor, (int,)) if cursor else None
+    output = _list_fields(fields, ProgramResponse)
+    wanted = _parse_ids(ids)
+
+    async def load():
+        query = select(*_field_columns(_PROGRAM_COLUMNS, output, Program.id)).where(
+            Program.is_active == true()
+        )
+
+        if category:
+            query = query.where(Program.category == category)
+        if featured is not None:
+            query = query.where(Program.is_featured == featured)
+        if wanted:
+            return (await db.execute(query.where(Program.id.in_(wanted)))).all()
+        if after:
+            query = query.where(Program.id > after[0])
+        elif skip:
+            query = query.offset(skip)
+
+        programs = await db.execute(query.order_by(Program.id).limit(limit))
+        return programs.all()
+
+    key = response_cache.make_key(
+        "get_programs",
+        skip=None if cursor else skip,
+        cursor=cursor,
+        limit=limit,
+        category=category,
+        featured=featured,
+        fields=output,
+        ids=wanted,
+    )
+    return await _cached_json(
+        request,
+        db,
+        key,
+        ("programs",),
+        load,
+        next_cursor=None
+        if wanted
+        else _page_cursor(limit, lambda program: (program.id,)),
+        fields=output,
+        ids=wanted,
+    )
 
-    if category:
-        query = query.filter(Program.category == category)
-    if featured is not None:
-        query = query.filter(Program.is_featured == featured)
 
-    programs = query.offset(skip).limit(limit).all()
-    return programs
+@router.get("/api/programs/featured", response_model=list[ProgramListItem])
+async def get_featured_programs(
+    request: Request,
+    fields: str | None = _FIELDS_QUERY,
+    db: AsyncSession = _DB,
+):
+    output = _list_fields(fields, ProgramResponse)
 
+    async def load():
+        programs = await db.execute(
+            _featured_programs_query(_field_columns(_PROGRAM_COLUMNS, output))
+        )
+        return programs.all()
 
-@router.get("/api/programs/featured", response_model=list[ProgramResponse])
-async def get_featured_programs(db: Session = Depends(get_db)):
-    programs = db.query(Program).filter(Program.is_active, Program.is_featured).all()
-    return programs
+    key = response_cache.make_key("get_featured_programs", fields=output)
+    return await _cached_json(request, db, key, ("programs",), load, fields=output)
 
 
 @router.get("/api/programs/{program_id}", response_model=ProgramResponse)
-async def get_program(program_id: int, db: Session = Depends(get_db)):
-    program = (
-        db.query(Program).filter(Program.id == program_id, Program.is_active).first()
+async def get_program(program_id: int, db: AsyncSession = _DB):
+    program = await db.scalar(
+        select(Program).where(Program.id == program_id, Program.is_active == true())
     )
     if not program:
         raise HTTPException(status_code=404, detail="Program not found")
+    await attach_image_variants(db, [program])
     return program
 
 
 @router.put("/api/programs/{program_id}")
 async def update_program(
     program_id: int,
+    background_tasks: BackgroundTasks,
     title: str | None = None,
     description: str | None = None,
     category: Literal["Leadership", "Agriculture", "Digital Skill", "Environment"]
     | None = None,
     content: str | None = None,
     is_featured: bool | None = None,
-    featured_image_file: UploadFile | None = File(None),
-    db: Session = Depends(get_db),
-    _: None = Depends(verify_api_key),
+    featured_image_file: UploadFile | None = _IMAGE_FILE,
+    db: AsyncSession = _DB,
+    _: None = _API_KEY,
 ) -> ProgramResponse:
     """Update an existing program with optional image upload."""
-    db_program = db.query(Program).filter(Program.id == program_id).first()
+    db_program = await db.get(Program, program_id)
     if not db_program:
         raise HTTPException(status_code=404, detail="Program not found")
 
     # Handle image upload if provided
+    previous_image = db_program.featured_image
     if featured_image_file:
         upload_dir = get_upload_directory()
         featured_image_path = await save_upload_file(featured_image_file, upload_dir)
+        background_tasks.add_task(process_image, featured_image_path)
         db_program.featured_image = featured_image_path
 
     # Update other fields if provided
@@ -141,29 +499,35 @@ async def update_program(
     if is_featured is not None:
         db_program.is_featured = is_featured
 
-    db.commit()
-    db.refresh(db_program)
+    await db.commit()
+    response_cache.invalidate("programs")
+    if previous_image != db_program.featured_image:
+        # Drop the replaced file unless another row still uses it
+        await release_upload(db, previous_image)
+    await db.refresh(db_program)
     return db_program
 
 
 @router.delete("/api/programs/{program_id}")
 async def delete_program(
     program_id: int,
-    db: Session = Depends(get_db),
-    _: None = Depends(verify_api_key),
+    db: AsyncSession = _DB,
+    _: None = _API_KEY,
 ):
-    db_program = db.query(Program).filter(Program.id == program_id).first()
+    db_program = await db.get(Program, program_id)
     if not db_program:
         raise HTTPException(status_code=404, detail="Program not found")
 
     db_program.is_active = False
-    db.commit()
+    await db.commit()
+    response_cache.invalidate("programs")
     return {"message": "Program deleted successfully"}
 
 
 # Events API endpoints
 @router.post("/api/events")
 async def create_event(
+    background_tasks: BackgroundTasks,
     title: str,
     description: str,
     event_type: Literal["Leadership", "Agriculture", "Digital Skill", "Environment"],
@@ -174,9 +538,9 @@ async def create_event(
     content: str | None = None,
     registration_deadline: datetime | None = None,
     is_featured: bool = False,
-    featured_image_file: UploadFile | None = File(None),
-    db: Session = Depends(get_db),
-    _: None = Depends(verify_api_key),
+    featured_image_file: UploadFile | None = _IMAGE_FILE,
+    db: AsyncSession = _DB,
+    _: None = _API_KEY,
 ) -> EventResponse:
     """Create a new event with optional image upload."""
     # Handle image upload if provided
@@ -184,6 +548,7 @@ async def create_event(
     if featured_image_file:
         upload_dir = get_upload_directory()
         featured_image_path = await save_upload_file(featured_image_file, upload_dir)
+        background_tasks.add_task(process_image, featured_image_path)
 
     # Create event data
     event_data = {
@@ -202,104 +567,235 @@ async def create_event(
 
     db_event = Event(**event_data)
     db.add(db_event)
-    db.commit()
-    db.refresh(db_event)
+    await db.commit()
+    response_cache.invalidate("events")
+    await db.refresh(db_event)
     return db_event
 
 
 @router.post("/api/events/register")
 async def register_for_event(
     registration: EventRegistrationSchema,
-    db: Session = Depends(get_db),
+    db: AsyncSession = _DB,
 ) -> dict:
-    """Register a user for an event."""
+    """Register a user for an event.
+
+    The seat is claimed with a conditional UPDATE of ``registered_count``
+    and duplicates are rejected by unique indexes, so concurrent signups can
+    neither overbook the event nor register the same person twice. Writes
+    go through the group-committing ``registration_writer`` unless
+    ``UYD_REGISTRATION_GROUP_COMMIT=0``.
+    """
     # Check if event exists
-    event = (
-        db.query(Event)
-        .filter(Event.id == registration.event_id, Event.is_active)
-        .first()
+    event = await db.scalar(
+        select(Event).where(
+            Event.id == registration.event_id, Event.is_active == true()
+        )
     )
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
 
-    existing_registration = (
-        db.query(EventRegistration)
-        .filter(
-            EventRegistration.event_id == registration.event_id,
-            or_(
-                EventRegistration.user_email == registration.user_email,
-                EventRegistration.user_mobile_number == registration.user_mobile_number,
-            ),
-        )
-        .first()
-    )
-
-    if existing_registration:
+    # Rejects most late signups early; the seat claim re-checks the deadline
+    if event.registration_deadline and event.registration_deadline < utcnow():
+        raise HTTPException(status_code=400, detail="Registration deadline has passed")
+
+    if registration_writer.enabled:
+        # Return the connection to the pool before waiting on the writer
+        await db.commit()
+        outcome = await registration_writer.submit(registration)
+    else:
+        outcome = await write_registration(db, registration)
+        await db.commit()
+
+    if outcome == CLOSED:
+        raise HTTPException(status_code=400, detail="Registration deadline has passed")
+    if outcome == FULL:
+        raise HTTPException(status_code=409, detail="Event is full")
+    if outcome == DUPLICATE:
         raise HTTPException(
             status_code=400, detail="User already registered for this event"
         )
 
-    new_event = EventRegistration(
-        event_id=registration.event_id,
-        user_name=registration.user_name,
-        user_email=registration.user_email,
-        user_mobile_number=registration.user_mobile_number,
-    )
-    db.add(new_event)
-    db.commit()
-    db.refresh(new_event)
-
+    is_waitlisted = outcome == WAITLISTED
+    if is_waitlisted:
+        return {
+            "message": f"{registration.user_name} is on the waitlist for event {event.title}",
+            "waitlisted": True,
+        }
     return {
-        "message": f"Successfully registered {registration.user_name} for event {event.title}"
+        "message": f"Successfully registered {registration.user_name} for event {event.title}",
+        "waitlisted": False,
     }
 
 
-@router.get("/api/events", response_model=list[EventResponse])
+_EXPORT_FORMAT_QUERY = Query(
+    "csv", alias="format", description="`csv` or `ndjson` (one JSON object per line)"
+)
+
+
+def _export_response(filename: str, export_format: str, **filters) -> StreamingResponse:
+    return StreamingResponse(
+        export_registrations(export_format, **filters),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format}"'
+        },
+    )
+
+
+@router.get("/api/events/registrations/export")
+async def export_all_registrations(
+    export_format: Literal["csv", "ndjson"] = _EXPORT_FORMAT_QUERY,
+    confirmed: bool | None = None,
+    registered_from: datetime | None = None,
+    registered_to: datetime | None = None,
+    _: None = _API_KEY,
+) -> StreamingResponse:
+    """Stream the registrations of every event.
+
+    ``registered_from`` is inclusive and ``registered_to`` exclusive.
+    """
+    return _export_response(
+        "registrations",
+        export_format,
+        confirmed=confirmed,
+        registered_from=registered_from,
+        registered_to=registered_to,
+    )
+
+
+@router.get("/api/events/{event_id}/registrations/export")
+async def export_event_registrations(
+    event_id: int,
+    export_format: Literal["csv", "ndjson"] = _EXPORT_FORMAT_QUERY,
+    confirmed: bool | None = None,
+    registered_from: datetime | None = None,
+    registered_to: datetime | None = None,
+    db: AsyncSession = _DB,
+    _: None = _API_KEY,
+) -> StreamingResponse:
+    """Stream the registrations of one event, including inactive events."""
+    if await db.get(Event, event_id) is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return _export_response(
+        f"event-{event_id}-registrations",
+        export_format,
+        event_id=event_id,
+        confirmed=confirmed,
+        registered_from=registered_from,
+        registered_to=registered_to,
+    )
+
+
+@router.get("/api/events", response_model=list[EventListItem | NotFoundItem])
 async def get_events(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    skip: int = _SKIP_QUERY,
+    limit: int = _LIMIT_QUERY,
+    cursor: str | None = _CURSOR_QUERY,
     event_type: Literal["Leadership", "Agriculture", "Digital Skill", "Environment"]
     | None = None,
     featured: bool | None = None,
     upcoming: bool | None = None,
-    db: Session = Depends(get_db),
+    fields: str | None = _FIELDS_QUERY,
+    ids: str | None = _IDS_QUERY,
+    db: AsyncSession = _DB,
 ):
-    query = db.query(Event).filter(Event.is_active)
-
-    if event_type:
-        query = query.filter(Event.event_type == event_type)
-    if featured is not None:
-        query = query.filter(Event.is_featured == featured)
-    if upcoming:
-        query = query.filter(Event.start_date >= datetime.utcnow())
+    limit = clamp_limit(limit)
+    after = decode_cursor(cursor, (datetime, int)) if cursor else None
+    output = _list_fields(fields, EventResponse)
+    wanted = _parse_ids(ids)
+
+    async def load():
+        query = select(
+            *_field_columns(_EVENT_COLUMNS, output, Event.start_date, Event.id)
+        ).where(Event.is_active == true())
+
+        if event_type:
+            query = query.where(Event.event_type == event_type)
+        if featured is not None:
+            query = query.where(Event.is_featured == featured)
+        if upcoming:
+            query = query.where(Event.start_date >= utcnow())
+        if wanted:
+            return (await db.execute(query.where(Event.id.in_(wanted)))).all()
+        if after:
+            query = query.where(tuple_(Event.start_date, Event.id) > after)
+        elif skip:
+            query = query.offset(skip)
+
+        events = await db.execute(
+            query.order_by(Event.start_date, Event.id).limit(limit)
+        )
+        return events.all()
+
+    key = response_cache.make_key(
+        "get_events",
+        skip=None if cursor else skip,
+        cursor=cursor,
+        limit=limit,
+        event_type=event_type,
+        featured=featured,
+        upcoming=upcoming or None,
+        fields=output,
+        ids=wanted,
+    )
+    return await _cached_json(
+        request,
+        db,
+        key,
+        ("events",),
+        load,
+        next_cursor=None
+        if wanted
+        else _page_cursor(limit, lambda event: (event.start_date, event.id)),
+        fields=output,
+        ids=wanted,
+        until_next_start=upcoming,
+    )
 
-    events = query.order_by(Event.start_date).offset(skip).limit(limit).all()
-    return events
 
+@router.get("/api/events/upcoming", response_model=list[EventListItem])
+async def get_upcoming_events(
+    request: Request,
+    fields: str | None = _FIELDS_QUERY,
+    db: AsyncSession = _DB,
+):
+    output = _list_fields(fields, EventResponse)
 
-@router.get("/api/events/upcoming", response_model=list[EventResponse])
-async def get_upcoming_events(db: Session = Depends(get_db)):
-    events = (
-        db.query(Event)
-        .filter(Event.is_active, Event.start_date >= datetime.utcnow())
-        .order_by(Event.start_date)
-        .limit(10)
-        .all()
+    async def load():
+        events = await db.execute(
+            _upcoming_events_query(_field_columns(_EVENT_COLUMNS, output))
+        )
+        return events.all()
+
+    key = response_cache.make_key("get_upcoming_events", fields=output)
+    return await _cached_json(
+        request,
+        db,
+        key,
+        ("events",),
+        load,
+        fields=output,
+        until_next_start=True,
     )
-    return events
 
 
 @router.get("/api/events/{event_id}", response_model=EventResponse)
-async def get_event(event_id: int, db: Session = Depends(get_db)):
-    event = db.query(Event).filter(Event.id == event_id, Event.is_active).first()
+async def get_event(event_id: int, db: AsyncSession = _DB):
+    event = await db.scalar(
+        select(Event).where(Event.id == event_id, Event.is_active == true())
+    )
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
+    await attach_image_variants(db, [event])
     return event
 
 
 @router.put("/api/events/{event_id}")
 async def update_event(
     event_id: int,
+    background_tasks: BackgroundTasks,
     title: str | None = None,
     description: str | None = None,
     event_type: str | None = None,
@@ -310,19 +806,21 @@ async def update_event(
     content: str | None = None,
     registration_deadline: datetime | None = None,
     is_featured: bool | None = None,
-    featured_image_file: UploadFile | None = File(None),
-    db: Session = Depends(get_db),
-    _: None = Depends(verify_api_key),
+    featured_image_file: UploadFile | None = _IMAGE_FILE,
+    db: AsyncSession = _DB,
+    _: None = _API_KEY,
 ) -> EventResponse:
     """Update an existing event with optional image upload."""
-    db_event = db.query(Event).filter(Event.id == event_id).first()
+    db_event = await db.get(Event, event_id)
     if not db_event:
         raise HTTPException(status_code=404, detail="Event not found")
 
     # Handle image upload if provided
+    previous_image = db_event.featured_image
     if featured_image_file:
         upload_dir = get_upload_directory()
         featured_image_path = await save_upload_file(featured_image_file, upload_dir)
+        background_tasks.add_task(process_image, featured_image_path)
         db_event.featured_image = featured_image_path
 
     # Update other fields if provided
@@ -347,23 +845,28 @@ async def update_event(
     if is_featured is not None:
         db_event.is_featured = is_featured
 
-    db.commit()
-    db.refresh(db_event)
+    await db.commit()
+    response_cache.invalidate("events")
+    if previous_image != db_event.featured_image:
+        # Drop the replaced file unless another row still uses it
+        await release_upload(db, previous_image)
+    await db.refresh(db_event)
     return db_event
 
 
 @router.delete("/api/events/{event_id}")
 async def delete_event(
     event_id: int,
-    db: Session = Depends(get_db),
-    _: None = Depends(verify_api_key),
+    db: AsyncSession = _DB,
+    _: None = _API_KEY,
 ):
-    db_event = db.query(Event).filter(Event.id == event_id).first()
+    db_event = await db.get(Event, event_id)
     if not db_event:
         raise HTTPException(status_code=404, detail="Event not found")
 
     db_event.is_active = False
-    db.commit()
+    await db.commit()
+    response_cache.invalidate("events")
     return {"message": "Event deleted successfully"}
 
 
@@ -371,86 +874,301 @@ async def delete_event(
 @router.post("/api/news", response_model=NewsArticleResponse)
 async def create_news_article(
     article: NewsArticleCreate,
-    db: Session = Depends(get_db),
-    _: None = Depends(verify_api_key),
+    db: AsyncSession = _DB,
+    _: None = _API_KEY,
 ):
     db_article = NewsArticle(**article.dict())
     db.add(db_article)
-    db.commit()
-    db.refresh(db_article)
+    await db.commit()
+    response_cache.invalidate("news")
+    await db.refresh(db_article)
     return db_article
 
 
-@router.get("/api/news", response_model=list[NewsArticleResponse])
+@router.get("/api/news", response_model=list[NewsArticleListItem | NotFoundItem])
 async def get_news(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    skip: int = _SKIP_QUERY,
+    limit: int = _LIMIT_QUERY,
+    cursor: str | None = _CURSOR_QUERY,
     category: str | None = None,
     featured: bool | None = None,
-    db: Session = Depends(get_db),
+    fields: str | None = _FIELDS_QUERY,
+    ids: str | None = _IDS_QUERY,
+    db: AsyncSession = _DB,
 ):
-    query = db.query(NewsArticle).filter(NewsArticle.is_active)
+    limit = clamp_limit(limit)
+    after = decode_cursor(cursor, (datetime, int)) if cursor else None
+    output = _list_fields(fields, NewsArticleResponse)
+    wanted = _parse_ids(ids)
+
+    async def load():
+        query = select(
+            *_field_columns(
+                _NEWS_COLUMNS, output, NewsArticle.publish_date, NewsArticle.id
+            )
+        ).where(NewsArticle.is_active == true())
+
+        if category:
+            query = query.where(NewsArticle.category == category)
+        if featured is not None:
+            query = query.where(NewsArticle.is_featured == featured)
+        if wanted:
+            return (await db.execute(query.where(NewsArticle.id.in_(wanted)))).all()
+        if after:
+            query = query.where(
+                tuple_(NewsArticle.publish_date, NewsArticle.id) < after
+            )
+        elif skip:
+            query = query.offset(skip)
+
+        news = await db.execute(
+            query.order_by(
+                NewsArticle.publish_date.desc(), NewsArticle.id.desc()
+            ).limit(limit)
+        )
+        return news.all()
+
+    key = response_cache.make_key(
+        "get_news",
+        skip=None if cursor else skip,
+        cursor=cursor,
+        limit=limit,
+        category=category,
+        featured=featured,
+        fields=output,
+        ids=wanted,
+    )
+    return await _cached_json(
+        request,
+        db,
+        key,
+        ("news",),
+        load,
+        next_cursor=None
+        if wanted
+        else _page_cursor(limit, lambda article: (article.publish_date, article.id)),
+        fields=output,
+        ids=wanted,
+    )
 
-    if category:
-        query = query.filter(NewsArticle.category == category)
-    if featured is not None:
-        query = query.filter(NewsArticle.is_featured == featured)
 
-    news = (
-        query.order_by(NewsArticle.publish_date.desc()).offset(skip).limit(limit).all()
-    )
-    return news
+@router.get("/api/news/latest", response_model=list[NewsArticleListItem])
+async def get_latest_news(
+    request: Request,
+    fields: str | None = _FIELDS_QUERY,
+    db: AsyncSession = _DB,
+):
+    output = _list_fields(fields, NewsArticleResponse)
 
+    async def load():
+        news = await db.execute(
+            _latest_news_query(_field_columns(_NEWS_COLUMNS, output))
+        )
+        return news.all()
 
-@router.get("/api/news/latest", response_model=list[NewsArticleResponse])
-async def get_latest_news(db: Session = Depends(get_db)):
-    news = (
-        db.query(NewsArticle)
-        .filter(NewsArticle.is_active)
-        .order_by(NewsArticle.publish_date.desc())
-        .limit(10)
-        .all()
-    )
-    return news
+    key = response_cache.make_key("get_latest_news", fields=output)
+    return await _cached_json(request, db, key, ("news",), load, fields=output)
 
 
-@router.get("/api/news/featured", response_model=list[NewsArticleResponse])
-async def get_featured_news(db: Session = Depends(get_db)):
-    news = (
-        db.query(NewsArticle)
-        .filter(NewsArticle.is_active, NewsArticle.is_featured)
-        .order_by(NewsArticle.publish_date.desc())
-        .limit(5)
-        .all()
-    )
-    return news
+@router.get("/api/news/featured", response_model=list[NewsArticleListItem])
+async def get_featured_news(
+    request: Request,
+    fields: str | None = _FIELDS_QUERY,
+    db: AsyncSession = _DB,
+):
+    output = _list_fields(fields, NewsArticleResponse)
+
+    async def load():
+        news = await db.execute(
+            select(*_field_columns(_NEWS_COLUMNS, output))
+            .where(NewsArticle.is_active == true(), NewsArticle.is_featured == true())
+            .order_by(NewsArticle.publish_date.desc())
+            .limit(5)
+        )
+        return news.all()
+
+    key = response_cache.make_key("get_featured_news", fields=output)
+    return await _cached_json(request, db, key, ("news",), load, fields=output)
 
 
 @router.get("/api/news/{article_id}", response_model=NewsArticleResponse)
-async def get_news_article(article_id: int, db: Session = Depends(get_db)):
-    article = (
-        db.query(NewsArticle)
-        .filter(NewsArticle.id == article_id, NewsArticle.is_active)
-        .first()
+async def get_news_article(article_id: int, db: AsyncSession = _DB):
+    article = await db.scalar(
+        select(NewsArticle).where(
+            NewsArticle.id == article_id, NewsArticle.is_active == true()
+        )
     )
     if not article:
         raise HTTPException(status_code=404, detail="Article not found")
+    await attach_image_variants(db, [article])
     return article
 
 
-# Site stats endpoint
-@router.get("/api/core/stats")
-async def get_site_stats(db: Session = Depends(get_db)):
-    programs_count = db.query(Program).filter(Program.is_active).count()
-    events_count = db.query(Event).filter(Event.is_active).count()
-    news_count = db.query(NewsArticle).filter(NewsArticle.is_active).count()
+_CHUNK_SIZE_QUERY = Query(IMPORT_CHUNK_SIZE, ge=1, le=MAX_IMPORT_CHUNK_SIZE)
+
+
+# Bulk import endpoint
+@router.post("/api/import/{entity}", response_model=ImportResult)
+async def bulk_import(
+    request: Request,
+    entity: Literal["programs", "events", "news"],
+    chunk_size: int = _CHUNK_SIZE_QUERY,
+    db: AsyncSession = _DB,
+    _: None = _API_KEY,
+):
+    """Insert or update rows from a streamed NDJSON body.
+
+    Each line is validated like the create endpoints. Lines with an ``id``
+    are upserted, the rest are inserted, ``chunk_size`` rows per
+    transaction. Rejected lines are listed with their line number and do
+    not stop the import.
+    """
+    report = await import_ndjson(db, entity, request.stream(), chunk_size)
+    if report.inserted or report.updated:
+        response_cache.invalidate(entity)
+    return report
+
+
+_SEARCH_TERM_QUERY = Query(min_length=1, max_length=200)
+_SEARCH_TYPE_QUERY = Query(None, alias="type")
+
+
+# Search endpoint
+@router.get("/api/search", response_model=list[SearchResult])
+async def search_content(
+    q: str = _SEARCH_TERM_QUERY,
+    entity_types: list[Literal["events", "news", "programs"]]
+    | None = _SEARCH_TYPE_QUERY,
+    limit: int = 20,
+    db: AsyncSession = _DB,
+):
+    """Full-text search across events, news and programs, best match first."""
+    entities = list(dict.fromkeys(entity_types or SEARCH_ENTITIES))
+    return await search(db, q, entities, clamp_limit(limit))
+
+
+# Batch endpoint
+@router.post("/api/batch", response_model=list[BatchResult])
+async def batch_requests(request: Request, batch: BatchRequest):
+    """Serve several GET requests in one round trip.
+
+    Sub-requests run in order through the normal routes, share one database
+    session and read from one snapshot, so e.g. an event and its related
+    news cannot straddle a write. The response cache is bypassed for them,
+    since a cached entry may predate the snapshot. Results come back in
+    request order, each with its own status; a missing item is a 404 in its
+    slot rather than a failed batch.
+    """
+    if len(batch.requests) > BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"A batch can hold at most {BATCH_MAX_REQUESTS} requests",
+        )
+    for path in batch.requests:
+        error = batch_path_error(path)
+        if error:
+            raise HTTPException(status_code=400, detail=f"{error}: {path}")
+
+    async with snapshot_session() as db:
+        token = shared_session.set(db)
+        try:
+            with response_cache.bypassed():
+                return [
+                    await dispatch_get(request.app, request.scope, path)
+                    for path in batch.requests
+                ]
+        finally:
+            shared_session.reset(token)
+
 
+# Site stats endpoint
+def _site_stats(counters: dict[str, int]) -> dict:
     # Mock subscriber count - in real app, you'd have a subscribers table
     subscribers_count = 1250
 
     return {
-        "programs": {"total": programs_count},
-        "events": {"total": events_count},
-        "news": {"total": news_count},
+        "programs": {"total": counters["programs"]},
+        "events": {
+            "total": counters["events"],
+            "upcoming": counters["upcoming_events"],
+        },
+        "news": {"total": counters["news"]},
+        "registrations": {"total": counters["registrations"]},
         "engagement": {"subscribers": subscribers_count},
     }
+
+
+@router.get("/api/core/stats")
+async def get_site_stats(request: Request, db: AsyncSession = _DB):
+    """Site-wide totals, read from trigger-maintained counters."""
+    counters = await read_site_stats(db)
+    etag = make_etag("get_site_stats", sorted(counters.items()))
+    if is_not_modified(request, etag, None):
+        return _not_modified(etag, None)
+    return Response(
+        content=dump_json(_site_stats(counters)),
+        media_type="application/json",
+        headers=_validator_headers(etag, None),
+    )
+
+
+_HOME_ENTITIES = ("programs", "events", "news")
+
+# Homepage section -> (query, columns, response model), each sent as the
+# matching list endpoint sends it by default
+_HOME_SECTIONS = {
+    "featured_programs": (
+        _featured_programs_query,
+        _PROGRAM_COLUMNS,
+        ProgramResponse,
+    ),
+    "upcoming_events": (_upcoming_events_query, _EVENT_COLUMNS, EventResponse),
+    "latest_news": (_latest_news_query, _NEWS_COLUMNS, NewsArticleResponse),
+}
+
+
+@router.get("/api/core/home")
+async def get_home(request: Request, db: AsyncSession = _DB):
+    """Everything the homepage loads, in one response on one connection.
+
+    Returns the site stats with the featured programs, upcoming events and
+    latest news. The three lists are encoded once and kept in the response
+    cache until one of those entities changes or the next event starts. The stats are read from their
+    counters on every request, since registrations and the clock change them
+    without touching any list.
+    """
+    key = response_cache.make_key("get_home")
+    cached = response_cache.get(key)
+    if cached is None:
+        generation = response_cache.generation(_HOME_ENTITIES)
+        version = await _entity_version(db, _HOME_ENTITIES, (_next_event_start(),))
+        sections = {}
+        for name, (query, columns, schema) in _HOME_SECTIONS.items():
+            output = _list_fields(None, schema)
+            rows = (await db.execute(query(_field_columns(columns, output)))).all()
+            sections[name] = await _list_items(db, rows, output)
+        cached = (dump_json(sections), make_etag(key, version))
+        # The upcoming events change when the next one starts
+        response_cache.set(
+            key, cached, _HOME_ENTITIES, generation, ttl=_seconds_until(version[-1])
+        )
+
+    sections_body, sections_etag = cached
+    counters = await read_site_stats(db)
+    etag = make_etag(sections_etag, sorted(counters.items()))
+    if is_not_modified(request, etag, None):
+        return _not_modified(etag, None)
+    # Splice the stats in front of the cached lists instead of re-encoding them
+    body = b'{"stats":' + dump_json(_site_stats(counters)) + b"," + sections_body[1:]
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers=_validator_headers(etag, None),
+    )
+
+
+@router.get("/api/core/cache")
+async def get_cache_stats(_: None = _API_KEY) -> dict:
+    """Hit/miss counters for the in-process response cache."""
+    return response_cache.stats()
@@ -1,88 +1,291 @@
 """HTML pages."""
 
+import os
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlencode
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import func
-from sqlalchemy.orm import Session
-
-from src.app.database.config import get_db
-from src.app.database.tables import Event
+from sqlalchemy import false, func, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.database.config import get_async_db
+from src.app.database.search import build_match_query, matching_ids
+from src.app.database.tables import Event, NewsArticle, Program
+from src.app.utils.assets import asset_url
+from src.app.utils.fragments import FragmentCache
+from src.app.utils.image_variants import attach_image_variants, load_image_variants
+from src.app.utils.prerender import PRERENDER_PAGES, StaticPageCache
+from src.app.utils.response_cache import response_cache
+from src.app.utils.templating import create_template_env, warm_templates
 
 base_dir = Path(__file__).parent.parent.parent
 
 
 router = APIRouter()
 
+_DB = Depends(get_async_db)
+_PAGE_QUERY = Query(1, ge=1)
+
 
 # Template setup
-templates = Jinja2Templates(directory=str(base_dir / "templates"))
+templates = Jinja2Templates(env=create_template_env(base_dir / "templates"))
+templates.env.globals["asset_url"] = asset_url
+
+# Templates that take no context, rendered once and served from memory
+STATIC_TEMPLATES = (
+    "index.html",
+    "about.html",
+    "contact.html",
+    "get-involved.html",
+    "students-life.html",
+    "privacy.html",
+    "terms-of-service.html",
+    "404.html",
+)
+static_pages = StaticPageCache(templates.env)
+
+# Per-item HTML of the server-rendered news and programs pages
+fragments = FragmentCache(templates.env, "fragments.html")
+
+# Items per page of the news and programs listings
+HTML_PAGE_SIZE = int(os.getenv("UYD_HTML_PAGE_SIZE", "9"))
+
+
+def load_templates() -> int:
+    """Load every template ahead of the first request that needs it."""
+    return warm_templates(templates.env)
+
+
+def warm_static_pages() -> None:
+    """Render and compress every static page ahead of the first request."""
+    if PRERENDER_PAGES:
+        static_pages.warm(STATIC_TEMPLATES)
+
+
+def _static_page(request: Request, name: str):
+    if PRERENDER_PAGES:
+        return static_pages.response(request, name)
+    return templates.TemplateResponse(name, {"request": request})
+
+
+def _not_found(request: Request):
+    return templates.TemplateResponse("404.html", {"request": request}, status_code=404)
+
+
+def _page_links(path: str, page: int, total: int, **filters) -> dict:
+    """Numbered links for the pagination bar, keeping the active filters.
+
+    The first, last and neighbouring pages are linked; other runs of pages
+    collapse into an ellipsis, written as ``(None, None)``.
+    """
+    last = max(1, -(-total // HTML_PAGE_SIZE))
+    params = {name: value for name, value in filters.items() if value}
+
+    def url(number: int) -> str:
+        query = {**params, "page": number} if number > 1 else params
+        return f"{path}?{urlencode(query)}" if query else path
+
+    shown = sorted(
+        {1, 2, page - 1, page, page + 1, last - 1, last} & set(range(1, last + 1))
+    )
+    links, previous = [], 0
+    for number in shown:
+        if number - previous > 1:
+            links.append((None, None))
+        links.append((number, url(number)))
+        previous = number
+    return {
+        "page": page,
+        "last": last,
+        "links": links,
+        "previous": url(page - 1) if page > 1 else None,
+        "next": url(page + 1) if page < last else None,
+    }
+
+
+def _render_items(macro: str, rows, variants: dict) -> list:
+    """Render ``macro`` for each row, reusing fragments whose row is unchanged.
+
+    ``variants`` maps featured images to their resized copies, as returned
+    by ``load_image_variants``.
+    """
+    return [
+        fragments.render(
+            macro,
+            (row.id, row.updated_at),
+            row,
+            variants.get(row.featured_image),
+        )
+        for row in rows
+    ]
+
+
+async def _category_counts(db_session: AsyncSession, entity: str, model):
+    """``(category, count)`` of active rows, cached until ``entity`` changes."""
+    key = response_cache.make_key("page_categories", entity=entity)
+    counts = response_cache.get(key)
+    if counts is not None:
+        return counts
+
+    generation = response_cache.generation((entity,))
+    counts = (
+        await db_session.execute(
+            select(model.category, func.count(model.id))
+            .where(model.is_active == true())
+            .group_by(model.category)
+            .order_by(model.category)
+        )
+    ).all()
+    counts = [(category, count) for category, count in counts]
+    response_cache.set(key, counts, (entity,), generation)
+    return counts
+
+
+def _filtered_count(categories, category: str | None) -> int:
+    """Number of active rows in ``category``, or in total without one."""
+    if category:
+        return dict(categories).get(category, 0)
+    return sum(count for _, count in categories)
+
+
+async def _event_facets(db_session: AsyncSession, now: datetime):
+    """Per-type counts and total of events that have not ended yet.
+
+    Built with a single GROUP BY whose per-group ``min(end_date)`` tells when
+    the next counted event ends. The result is cached until then, or until
+    an event write invalidates it.
+    """
+    key = response_cache.make_key("events_page_facets")
+    facets = response_cache.get(key)
+    if facets is not None:
+        return facets
+
+    generation = response_cache.generation(("events",))
+    rows = (
+        await db_session.execute(
+            select(Event.event_type, func.count(Event.id), func.min(Event.end_date))
+            .where(Event.is_active == true())
+            .where(Event.end_date >= now)
+            .group_by(Event.event_type),
+        )
+    ).all()
+
+    event_type_counts = [(event_type, count) for event_type, count, _ in rows]
+    total_count = sum(count for _, count in event_type_counts)
+    next_end = min((end for *_, end in rows if end is not None), default=None)
+    ttl = (next_end - now).total_seconds() if next_end else None
+
+    facets = (event_type_counts, total_count)
+    response_cache.set(key, facets, ("events",), generation, ttl=ttl)
+    return facets
 
 
 # Template Routes - Serve HTML pages
 @router.get("/")
 async def home(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    return _static_page(request, "index.html")
 
 
 @router.get("/about")
 @router.get("/about.html")
 async def about(request: Request):
-    return templates.TemplateResponse("about.html", {"request": request})
+    return _static_page(request, "about.html")
+
+
+# Columns the program cards show
+_PROGRAM_CARD_COLUMNS = (
+    Program.id,
+    Program.title,
+    Program.description,
+    Program.category,
+    Program.featured_image,
+    Program.is_featured,
+    Program.updated_at,
+)
 
 
 @router.get("/programs")
 @router.get("/programs.html")
-async def programs(request: Request):
-    return templates.TemplateResponse("programs.html", {"request": request})
+async def programs(
+    request: Request,
+    db_session: AsyncSession = _DB,
+    category: str | None = None,
+    page: int = _PAGE_QUERY,
+):
+    categories = await _category_counts(db_session, "programs", Program)
+
+    query = select(*_PROGRAM_CARD_COLUMNS).where(Program.is_active == true())
+    if category:
+        query = query.where(Program.category == category)
+
+    rows = (
+        await db_session.execute(
+            query.order_by(Program.is_featured.desc(), Program.id)
+            .offset((page - 1) * HTML_PAGE_SIZE)
+            .limit(HTML_PAGE_SIZE)
+        )
+    ).all()
+    variants = await load_image_variants(
+        db_session, (row.featured_image for row in rows)
+    )
+
+    return templates.TemplateResponse(
+        "programs.html",
+        {
+            "request": request,
+            "cards": _render_items("program_card", rows, variants),
+            "categories": categories,
+            "total_count": sum(count for _, count in categories),
+            "category": category,
+            "pages": _page_links(
+                "programs.html",
+                page,
+                _filtered_count(categories, category),
+                category=category,
+            ),
+        },
+    )
 
 
 @router.get("/events")
 @router.get("/events.html")
 async def events(
     request: Request,
-    db_session: Session = Depends(get_db),
+    db_session: AsyncSession = _DB,
     search: str | None = None,
     event_type: str | None = None,
 ):
+    now = datetime.now()
+
     # Base query - events that are active and have not ended yet
-    query = (
-        db_session.query(Event)
-        .filter(Event.is_active)
-        .filter(Event.end_date >= datetime.now())
-    )
+    query = select(Event).where(Event.is_active == true()).where(Event.end_date >= now)
 
-    # Apply search filter (case-insensitive search in title and description)
+    # Apply search filter through the full-text index; a search without any
+    # searchable words matches nothing
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (Event.title.ilike(search_term)) | (Event.description.ilike(search_term)),
-        )
+        match = build_match_query(search)
+        if match is None:
+            query = query.where(false())
+        else:
+            query = query.where(Event.id.in_(matching_ids("events"))).params(
+                match=match
+            )
 
     # Apply event type filter
     if event_type:
-        query = query.filter(Event.event_type == event_type)
+        query = query.where(Event.event_type == event_type)
 
     # Get filtered events (limit to 17)
-    events = query.order_by(Event.start_date).offset(0).limit(17).all()
-
-    event_type_counts = (
-        db_session.query(Event.event_type, func.count(Event.id))
-        .filter(Event.is_active)
-        .filter(Event.end_date >= datetime.now())
-        .group_by(Event.event_type)
-        .all()
-    )
+    events = (
+        await db_session.scalars(
+            query.order_by(Event.start_date).offset(0).limit(17),
+        )
+    ).all()
 
-    # Get total count
-    total_count = (
-        db_session.query(func.count(Event.id))
-        .filter(Event.is_active)
-        .filter(Event.end_date >= datetime.now())
-        .scalar()
-    )
+    # Sidebar counts and total, normally served from cache
+    event_type_counts, total_count = await _event_facets(db_session, now)
 
     if events:
         events = [
@@ -129,33 +332,134 @@ async def events(
 @router.get("/contact")
 @router.get("/contact.html")
 async def contact(request: Request):
-    return templates.TemplateResponse("contact.html", {"request": request})
+    return _static_page(request, "contact.html")
 
 
 @router.get("/get-involved")
 @router.get("/get-involved.html")
 async def get_involved(request: Request):
-    return templates.TemplateResponse("get-involved.html", {"request": request})
+    return _static_page(request, "get-involved.html")
+
+
+# Columns the news cards show; articles without an excerpt get the start
+# of their content instead
+_NEWS_CARD_COLUMNS = (
+    NewsArticle.id,
+    NewsArticle.title,
+    NewsArticle.category,
+    NewsArticle.author,
+    NewsArticle.publish_date,
+    NewsArticle.featured_image,
+    NewsArticle.updated_at,
+    func.coalesce(NewsArticle.excerpt, func.substr(NewsArticle.content, 1, 200)).label(
+        "excerpt"
+    ),
+)
+
+
+def _latest_news_query(*columns):
+    return (
+        select(*columns)
+        .where(NewsArticle.is_active == true())
+        .order_by(NewsArticle.publish_date.desc(), NewsArticle.id.desc())
+    )
+
+
+async def _news_featured(db_session: AsyncSession, latest) -> list:
+    """Up to three featured articles, topped up with the latest ones."""
+    featured = (
+        await db_session.execute(
+            _latest_news_query(*_NEWS_CARD_COLUMNS)
+            .where(NewsArticle.is_featured == true())
+            .limit(3)
+        )
+    ).all()
+    shown = {row.id for row in featured}
+    return (
+        featured + [row for row in latest if row.id not in shown][: 3 - len(featured)]
+    )
 
 
 @router.get("/news")
 @router.get("/news.html")
-async def news(request: Request):
-    return templates.TemplateResponse("news.html", {"request": request})
+async def news(
+    request: Request,
+    db_session: AsyncSession = _DB,
+    search: str | None = None,
+    category: str | None = None,
+    page: int = _PAGE_QUERY,
+):
+    categories = await _category_counts(db_session, "news", NewsArticle)
+    filtered_count = _filtered_count(categories, category)
+
+    query = _latest_news_query(*_NEWS_CARD_COLUMNS)
+    if category:
+        query = query.where(NewsArticle.category == category)
+    if search:
+        match = build_match_query(search)
+        if match is None:
+            query = query.where(false())
+        else:
+            query = query.where(
+                NewsArticle.id.in_(matching_ids("news_articles"))
+            ).params(match=match)
+        # Only searches need counting; the cached category counts cover the rest
+        filtered_count = await db_session.scalar(
+            select(func.count()).select_from(query.order_by(None).subquery())
+        )
+
+    rows = (
+        await db_session.execute(
+            query.offset((page - 1) * HTML_PAGE_SIZE).limit(HTML_PAGE_SIZE)
+        )
+    ).all()
+
+    # The featured posts and latest-news sidebar lead the unfiltered first page
+    hero = None
+    if rows and page == 1 and not (category or search):
+        featured = await _news_featured(db_session, rows)
+        variants = await load_image_variants(
+            db_session, (row.featured_image for row in (*rows, *featured))
+        )
+        hero = {
+            "featured": _render_items("news_featured", featured[:1], variants)[0],
+            "secondary": _render_items("news_secondary", featured[1:], variants),
+            "latest": _render_items("news_tab_post", rows[:5], variants),
+        }
+    else:
+        variants = await load_image_variants(
+            db_session, (row.featured_image for row in rows)
+        )
+
+    return templates.TemplateResponse(
+        "news.html",
+        {
+            "request": request,
+            "hero": hero,
+            "cards": _render_items("news_card", rows, variants),
+            "categories": categories,
+            "total_count": sum(count for _, count in categories),
+            "search": search,
+            "category": category,
+            "pages": _page_links(
+                "news.html", page, filtered_count, category=category, search=search
+            ),
+        },
+    )
 
 
 @router.get("/event-details")
 @router.get("/event-details.html")
-async def event_details(
-    request: Request, id: int, db_session: Session = Depends(get_db)
-):
-    event = (
-        db_session.query(Event)
-        .filter(Event.id == id)
-        .filter(Event.is_active)
-        .filter(Event.end_date >= datetime.now())
-        .first()
+async def event_details(request: Request, id: int, db_session: AsyncSession = _DB):
+    event = await db_session.scalar(
+        select(Event)
+        .where(Event.id == id)
+        .where(Event.is_active == true())
+        .where(Event.end_date >= datetime.now()),
     )
+    if event is None:
+        return _not_found(request)
+    await attach_image_variants(db_session, [event])
     formatted = {
         "id": event.id,
         "title": event.title,
@@ -171,6 +475,7 @@ async def event_details(
         "is_featured": event.is_featured,
         "max_participants": event.max_participants,
         "featured_image": event.featured_image or "assets/img/education/events-3.webp",
+        "featured_image_variants": event.featured_image_variants,
         "registration_deadline": event.registration_deadline.strftime(
             "%Y-%m-%d",
         )
@@ -184,29 +489,62 @@ async def event_details(
 
 @router.get("/news-details")
 @router.get("/news-details.html")
-async def news_details(request: Request):
-    return templates.TemplateResponse("news-details.html", {"request": request})
+async def news_details(
+    request: Request, id: int | None = None, db_session: AsyncSession = _DB
+):
+    # The site navigation links here without an id; show the latest article
+    if id is None:
+        query = _latest_news_query(NewsArticle).limit(1)
+    else:
+        query = (
+            select(NewsArticle)
+            .where(NewsArticle.id == id)
+            .where(NewsArticle.is_active == true())
+        )
+    article = await db_session.scalar(query)
+    if article is None:
+        return _not_found(request)
+
+    recent = (
+        await db_session.execute(
+            _latest_news_query(*_NEWS_CARD_COLUMNS)
+            .where(NewsArticle.id != article.id)
+            .limit(3)
+        )
+    ).all()
+    variants = await load_image_variants(
+        db_session, (row.featured_image for row in (article, *recent))
+    )
+    return templates.TemplateResponse(
+        "news-details.html",
+        {
+            "request": request,
+            "article": article,
+            "body": _render_items("news_body", [article], variants)[0],
+            "recent": _render_items("news_card", recent, variants),
+        },
+    )
 
 
 @router.get("/students-life")
 @router.get("/students-life.html")
 async def students_life(request: Request):
-    return templates.TemplateResponse("students-life.html", {"request": request})
+    return _static_page(request, "students-life.html")
 
 
 @router.get("/privacy")
 @router.get("/privacy.html")
 async def privacy(request: Request):
-    return templates.TemplateResponse("privacy.html", {"request": request})
+    return _static_page(request, "privacy.html")
 
 
 @router.get("/terms-of-service")
 @router.get("/terms-of-service.html")
 async def terms_of_service(request: Request):
-    return templates.TemplateResponse("terms-of-service.html", {"request": request})
+    return _static_page(request, "terms-of-service.html")
 
 
 @router.get("/404")
 @router.get("/404.html")
 async def not_found(request: Request):
-    return templates.TemplateResponse("404.html", {"request": request})
+    return _static_page(request, "404.html")
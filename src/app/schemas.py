@@ -1,10 +1,19 @@
 from datetime import datetime
+from typing import Any, Literal
 
 from fastapi import UploadFile
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
 
 
 # Pydantic Models
+class ImageVariants(BaseModel):
+    """Resized copies of a featured image, for ``<picture>`` / ``srcset``."""
+
+    width: int
+    height: int
+    srcset: dict[str, str]  # MIME type -> "url 320w, url 640w, ..."
+
+
 class ProgramBase(BaseModel):
     title: str
     description: str
@@ -23,11 +32,18 @@ class ProgramResponse(ProgramBase):
     id: int
     created_at: datetime
     updated_at: datetime
+    featured_image_variants: ImageVariants | None = None
 
     class Config:
         from_attributes = True
 
 
+class ProgramImport(ProgramCreate):
+    """One NDJSON line of a bulk import. Rows with an ``id`` are upserted."""
+
+    id: int | None = Field(default=None, gt=0)
+
+
 class ProgramCreateWithImage(ProgramCreate):
     """Program creation schema with image upload support."""
 
@@ -57,11 +73,18 @@ class EventResponse(EventBase):
     id: int
     created_at: datetime
     updated_at: datetime
+    featured_image_variants: ImageVariants | None = None
 
     class Config:
         from_attributes = True
 
 
+class EventImport(EventCreate):
+    """One NDJSON line of a bulk import. Rows with an ``id`` are upserted."""
+
+    id: int | None = Field(default=None, gt=0)
+
+
 class EventCreateWithImage(EventCreate):
     """Event creation schema with image upload support."""
 
@@ -84,15 +107,52 @@ class NewsArticleCreate(NewsArticleBase):
     pass
 
 
+class NewsArticleImport(NewsArticleCreate):
+    """One NDJSON line of a bulk import. Rows with an ``id`` are upserted."""
+
+    id: int | None = Field(default=None, gt=0)
+
+
 class NewsArticleResponse(NewsArticleBase):
     id: int
     created_at: datetime
     updated_at: datetime
+    featured_image_variants: ImageVariants | None = None
 
     class Config:
         from_attributes = True
 
 
+def _list_item_model(response: type[BaseModel], name: str) -> type[BaseModel]:
+    """``response`` with no required fields, as served by the list endpoints.
+
+    A list item carries only the fields picked with ``fields=``, by default
+    every field except ``content``.
+    """
+    return create_model(
+        name,
+        __doc__=f"{response.__name__} limited to the fields picked with `fields=` "
+        "(by default all except `content`).",
+        **{
+            field_name: (field.annotation, None)
+            for field_name, field in response.model_fields.items()
+        },
+    )
+
+
+ProgramListItem = _list_item_model(ProgramResponse, "ProgramListItem")
+EventListItem = _list_item_model(EventResponse, "EventListItem")
+NewsArticleListItem = _list_item_model(NewsArticleResponse, "NewsArticleListItem")
+
+
+class NotFoundItem(BaseModel):
+    """Stands in for an ``ids=`` entry that has no item."""
+
+    id: int
+    status: Literal[404]
+    detail: str
+
+
 class EventRegistrationSchema(BaseModel):
     """Event registration Schema."""
 
@@ -109,3 +169,47 @@ class EventRegistrationSchema(BaseModel):
         min_length=10,
         max_length=15,
     )
+    waitlist: bool = Field(
+        default=False,
+        description="Join the waitlist instead of failing if the event is full",
+    )
+
+
+class ImportRowError(BaseModel):
+    line: int
+    error: str
+
+
+class ImportResult(BaseModel):
+    """Outcome of a bulk import. Only the first 1000 errors are listed."""
+
+    inserted: int
+    updated: int
+    failed: int
+    errors: list[ImportRowError]
+
+
+class BatchRequest(BaseModel):
+    """GET paths to serve in one round trip, e.g. ``/api/events?ids=1,5``."""
+
+    requests: list[str] = Field(min_length=1)
+
+
+class BatchResult(BaseModel):
+    """Outcome of one batched request, in the order it was asked for."""
+
+    path: str
+    status: int
+    headers: dict[str, str]
+    body: Any = None
+
+
+class SearchResult(BaseModel):
+    """Full-text search hit."""
+
+    type: Literal["events", "news", "programs"]
+    id: int
+    title: str
+    # HTML: escaped text with each match wrapped in <mark>
+    snippet: str
+    score: float
@@ -6,21 +6,18 @@ import hmac
 import os
 from hashlib import sha256
 
-from dotenv import load_dotenv
 from fastapi import Header, HTTPException, status
 
-load_dotenv()
-
-_UYD_API_KEY = os.getenv("UYD_API_KEY", "secret")
-
 
 def _get_api_key() -> str:
-    if not _UYD_API_KEY:
+    # Read per request, so tests and scripts can change it after import
+    api_key = os.getenv("UYD_API_KEY", "secret")
+    if not api_key:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="API key is not configured",
         )
-    return _UYD_API_KEY
+    return api_key
 
 
 def _digest(value: str) -> str:
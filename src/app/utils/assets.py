@@ -0,0 +1,195 @@
+"""Fingerprinted, precompressed static assets.
+
+``build_assets`` copies every file under ``src/assets`` into a build
+directory under a content-hashed name (``css/main.css`` becomes
+``css/main.<hash>.css``), writes ``.gz`` and ``.br`` sidecars next to text
+files, and records the mapping in ``manifest.json``. Templates link to the
+hashed names through the ``asset_url`` Jinja global, and ``AssetFiles``
+serves them with ``Cache-Control: immutable``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import mimetypes
+import os
+import posixpath
+import re
+import shutil
+from functools import lru_cache
+from hashlib import sha256
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from src.app.utils.http_cache import accepted_encodings
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+base_dir = Path(__file__).parent.parent.parent
+
+ASSETS_DIR = base_dir / "assets"
+ASSET_BUILD_DIR = Path(os.getenv("UYD_ASSET_BUILD_DIR", str(base_dir / "dist")))
+ASSETS_URL = "/assets"
+
+# Uploaded files change at runtime and scss is source only
+_SKIP_DIRS = {"upload", "scss"}
+
+# Already-compressed formats (images, woff2) gain nothing from a sidecar
+_COMPRESSIBLE = {".css", ".js", ".mjs", ".json", ".map", ".svg", ".txt", ".xml"}
+_COMPRESSIBLE |= {".ttf", ".eot", ".otf", ".woff"}
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+_CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+
+
+def _manifest_path(build_dir: Path) -> Path:
+    return build_dir / "manifest.json"
+
+
+def _hashed_name(path: str, content: bytes) -> str:
+    stem, ext = posixpath.splitext(path)
+    return f"{stem}.{sha256(content).hexdigest()[:12]}{ext}"
+
+
+def _rewrite_css_urls(css_path: str, css: bytes, manifest: dict[str, str]) -> bytes:
+    """Point ``url(...)`` references at the hashed names of their targets."""
+    css_dir = posixpath.dirname(css_path)
+
+    def replace(match: re.Match) -> str:
+        quote, ref = match.groups()
+        if ref.startswith(("data:", "http:", "https:", "//", "#", "/")):
+            return match.group(0)
+        # Keep cache-busting queries and fragments such as ``#iefix``
+        target, suffix = re.match(r"([^?#]*)(.*)", ref).groups()
+        resolved = posixpath.normpath(posixpath.join(css_dir, target))
+        if resolved not in manifest:
+            return match.group(0)
+        hashed = posixpath.relpath(manifest[resolved], css_dir or ".")
+        return f"url({quote}{hashed}{suffix}{quote})"
+
+    return _CSS_URL_RE.sub(replace, css.decode()).encode()
+
+
+def _write_compressed(path: Path, content: bytes) -> None:
+    # Only keep a sidecar when it saves a meaningful number of bytes
+    gz = gzip.compress(content, compresslevel=9, mtime=0)
+    if len(gz) < len(content) * 0.9:
+        path.with_name(path.name + ".gz").write_bytes(gz)
+    if brotli is not None:
+        br = brotli.compress(content, quality=11)
+        if len(br) < len(content) * 0.9:
+            path.with_name(path.name + ".br").write_bytes(br)
+
+
+def build_assets(
+    source_dir: Path = ASSETS_DIR, build_dir: Path = ASSET_BUILD_DIR
+) -> dict[str, str]:
+    """Write hashed copies, compressed sidecars and the manifest.
+
+    Stylesheets are processed last so their ``url(...)`` references can be
+    rewritten to already-hashed fonts and images before they are hashed
+    themselves.
+    """
+    if build_dir.exists():
+        shutil.rmtree(build_dir)
+    output_dir = build_dir / "assets"
+
+    files = sorted(
+        p.relative_to(source_dir).as_posix()
+        for p in source_dir.rglob("*")
+        if p.is_file() and p.relative_to(source_dir).parts[0] not in _SKIP_DIRS
+    )
+    files.sort(key=lambda path: path.endswith(".css"))
+
+    manifest: dict[str, str] = {}
+    for path in files:
+        content = (source_dir / path).read_bytes()
+        if path.endswith(".css"):
+            content = _rewrite_css_urls(path, content, manifest)
+        hashed = _hashed_name(path, content)
+        target = output_dir / hashed
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(content)
+        if posixpath.splitext(path)[1].lower() in _COMPRESSIBLE:
+            _write_compressed(target, content)
+        manifest[path] = hashed
+
+    _manifest_path(build_dir).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return manifest
+
+
+@lru_cache(maxsize=1)
+def load_manifest(build_dir: Path = ASSET_BUILD_DIR) -> dict[str, str]:
+    """The build manifest, or an empty mapping if assets were not built."""
+    try:
+        return json.loads(_manifest_path(build_dir).read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def asset_url(path: str) -> str:
+    """URL of ``path`` (relative to ``src/assets``), hashed when built.
+
+    Unbuilt paths fall back to the plain file so templates keep working
+    before ``build_assets.py`` has run.
+    """
+    return f"{ASSETS_URL}/{load_manifest().get(path, path)}"
+
+
+class AssetFiles(StaticFiles):
+    """``StaticFiles`` that prefers hashed, precompressed build output.
+
+    A request for a hashed name is answered from the build directory with
+    the smallest sidecar the client's ``Accept-Encoding`` allows and a
+    one-year immutable ``Cache-Control``. Any other path, such as uploads or
+    a template that has not been switched to ``asset_url``, is served from
+    the source directory as before.
+    """
+
+    def __init__(self, *, build_dir: Path = ASSET_BUILD_DIR, **kwargs):
+        super().__init__(**kwargs)
+        self.build_dir = build_dir / "assets"
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        full_path = (self.build_dir / path).resolve()
+        if (
+            scope["method"] in ("GET", "HEAD")
+            and full_path.is_relative_to(self.build_dir.resolve())
+            and full_path.is_file()
+        ):
+            return self.built_file_response(full_path, scope)
+        return await super().get_response(path, scope)
+
+    def built_file_response(self, full_path: Path, scope: Scope) -> Response:
+        request_headers = Headers(scope=scope)
+        accepted = accepted_encodings(request_headers.get("accept-encoding"))
+        media_type, _ = mimetypes.guess_type(full_path.name)
+
+        served, encoding = full_path, None
+        for candidate, suffix in (("br", ".br"), ("gzip", ".gz")):
+            sidecar = full_path.with_name(full_path.name + suffix)
+            if candidate in accepted and sidecar.is_file():
+                served, encoding = sidecar, candidate
+                break
+
+        headers = {"Cache-Control": IMMUTABLE, "Vary": "Accept-Encoding"}
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        response = FileResponse(
+            served,
+            stat_result=os.stat(served),
+            media_type=media_type or "application/octet-stream",
+            headers=headers,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,102 @@
+"""Run GET sub-requests of ``/api/batch`` through the app in-process.
+
+Each sub-request is dispatched through the full ASGI stack (middleware,
+routing, validation, dependencies) exactly as if it had arrived on its own,
+but without another HTTP round trip. The response body is collected in
+memory and decoded as JSON when the sub-response says it is JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from urllib.parse import unquote, urlsplit
+
+logger = logging.getLogger(__name__)
+
+BATCH_MAX_REQUESTS = int(os.getenv("UYD_BATCH_MAX_REQUESTS", "20"))
+
+# Request headers passed on from the batch request to every sub-request
+FORWARDED_HEADERS = (b"accept-language", b"authorization", b"x-api-key")
+
+# Response headers reported back for every sub-request
+REPORTED_HEADERS = ("etag", "last-modified", "x-next-cursor")
+
+
+def batch_path_error(path: str) -> str | None:
+    """Why ``path`` cannot be part of a batch, or None if it can."""
+    url = urlsplit(path)
+    if url.scheme or url.netloc or not url.path.startswith("/api/"):
+        return "Batch paths must start with /api/"
+    if url.path.rstrip("/") == "/api/batch":
+        return "Batches cannot be nested"
+    # A batch buffers every body in memory; exports and imports are too large
+    if url.path.rstrip("/").endswith("/registrations/export"):
+        return "Exports cannot be batched"
+    if url.path.startswith("/api/import/"):
+        return "Imports cannot be batched"
+    return None
+
+
+async def dispatch_get(app, parent_scope: dict, path: str) -> dict:
+    """Serve ``GET path`` through ``app`` and return its status, headers and body."""
+    url = urlsplit(path)
+    scope = {
+        "type": "http",
+        "asgi": parent_scope.get("asgi", {"version": "3.0"}),
+        "http_version": parent_scope.get("http_version", "1.1"),
+        "method": "GET",
+        "scheme": parent_scope.get("scheme", "http"),
+        "server": parent_scope.get("server"),
+        "client": parent_scope.get("client"),
+        "root_path": parent_scope.get("root_path", ""),
+        "path": unquote(url.path),
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "headers": [
+            (name, value)
+            for name, value in parent_scope["headers"]
+            if name in FORWARDED_HEADERS
+        ],
+        "state": dict(parent_scope.get("state", {})),
+    }
+
+    response = {"status": 500, "headers": [], "body": []}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = message.get("headers", [])
+        elif message["type"] == "http.response.body":
+            response["body"].append(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        # The error middleware has already sent a 500 for this slot; keep
+        # serving the rest of the batch
+        logger.exception("Batched request failed: GET %s", path)
+
+    headers = {
+        name.decode("latin-1").lower(): value.decode("latin-1")
+        for name, value in response["headers"]
+    }
+    body = b"".join(response["body"])
+    if not body:
+        content = None
+    elif headers.get("content-type", "").startswith("application/json"):
+        content = json.loads(body)
+    else:
+        content = body.decode("utf-8", errors="replace")
+    return {
+        "path": path,
+        "status": response["status"],
+        "headers": {
+            name: headers[name] for name in REPORTED_HEADERS if name in headers
+        },
+        "body": content,
+    }
@@ -0,0 +1,78 @@
+"""Rendered HTML fragments cached per entity version.
+
+Server-rendered list and detail pages are built from small per-item macros
+(a news card, a program card, an article body). Each rendered fragment is
+cached under the item's id and ``updated_at``. An edit bumps ``updated_at``,
+so the next render misses and the stale copy simply ages out of the LRU;
+writes never need to invalidate anything. Re-rendering a page only runs the
+macros for items that changed since they were last shown.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from jinja2 import Environment
+from markupsafe import Markup
+
+FRAGMENT_CACHE_SIZE = int(os.getenv("UYD_FRAGMENT_CACHE_SIZE", "2048"))
+
+
+class FragmentCache:
+    """LRU of macro output from one template, keyed on ``(macro, key)``.
+
+    With Jinja's ``auto_reload`` on, an edited template clears the cache the
+    next time one of its macros is rendered.
+    """
+
+    def __init__(
+        self, env: Environment, template: str, max_entries: int = FRAGMENT_CACHE_SIZE
+    ):
+        self.env = env
+        self.template = template
+        self.max_entries = max_entries
+        self._template = None
+        self._macros = None
+        self._entries: OrderedDict[tuple, Markup] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_macros(self):
+        # get_template returns a new object once the file has been edited
+        template = self.env.get_template(self.template)
+        if template is not self._template:
+            with self._lock:
+                self._entries.clear()
+            self._template, self._macros = template, template.module
+        return self._macros
+
+    def render(self, macro: str, key: Hashable, *args) -> Markup:
+        """Call ``macro(*args)``, or return its cached output for ``key``.
+
+        ``key`` must change whenever the output would, normally
+        ``(id, updated_at)`` of the rendered row.
+        """
+        macros = self._get_macros()
+        cache_key = (macro, key)
+        with self._lock:
+            html = self._entries.get(cache_key)
+            if html is not None:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return html
+            self.misses += 1
+
+        html = Markup(getattr(macros, macro)(*args))
+        with self._lock:
+            self._entries[cache_key] = html
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return html
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
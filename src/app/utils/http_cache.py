@@ -0,0 +1,81 @@
+"""HTTP conditional request helpers (ETag / Last-Modified)."""
+
+from __future__ import annotations
+
+import calendar
+from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
+from hashlib import sha256
+
+from fastapi import Request
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong ETag from values that identify a representation."""
+    digest = sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def _epoch_seconds(value: datetime) -> int:
+    """Whole seconds since the epoch for a naive UTC or aware datetime."""
+    # utctimetuple() leaves naive values as they are, i.e. treats them as UTC
+    return calendar.timegm(value.utctimetuple())
+
+
+def http_date(value: datetime) -> str:
+    """Format a naive UTC or aware datetime as an HTTP-date."""
+    return formatdate(_epoch_seconds(value), usegmt=True)
+
+
+def accepted_encodings(header: str | None) -> set[str]:
+    """Content codings an Accept-Encoding header allows (``q=0`` excluded)."""
+    accepted = {"identity"}
+    for part in (header or "").split(","):
+        coding, *params = (p.strip() for p in part.split(";"))
+        coding = coding.lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        codings = ("br", "gzip", "identity") if coding == "*" else (coding,)
+        if quality > 0:
+            accepted.update(codings)
+        else:
+            accepted.difference_update(codings)
+    return accepted
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag in candidates
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None = None
+) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since for a GET request.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    the client did not send an entity tag (RFC 9110, section 13.2.2).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP-dates have one-second resolution
+        return _epoch_seconds(last_modified) <= _epoch_seconds(since)
+    return False
@@ -1,12 +1,26 @@
 """Image upload utilities."""
 
-import uuid
+import hashlib
+import os
+import tempfile
 from pathlib import Path
+from typing import BinaryIO
 
 from fastapi import HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
 
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+CHUNK_SIZE = 64 * 1024  # 64KB
+UPLOAD_URL_PREFIX = "assets/upload/"
+
+# Leading bytes of each accepted format, mapped to the extension it is saved as
+_MAGIC_NUMBERS = (
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+)
 
 
 def get_file_extension(filename: str) -> str:
@@ -14,25 +28,45 @@ def get_file_extension(filename: str) -> str:
     return Path(filename).suffix.lower()
 
 
-def is_allowed_file(filename: str) -> bool:
-    """Check if file extension is allowed."""
-    return get_file_extension(filename) in ALLOWED_EXTENSIONS
+def detect_image_type(header: bytes) -> str | None:
+    """Return the extension for an image's leading bytes, or None."""
+    for magic, extension in _MAGIC_NUMBERS:
+        if header.startswith(magic):
+            return extension
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return ".webp"
+    return None
 
 
-async def validate_file_size(file: UploadFile) -> bool:
-    """Validate file size."""
-    file.file.seek(0, 2)  # Seek to end
-    size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning
-    return size <= MAX_FILE_SIZE
+def _file_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail=f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB",
+    )
 
 
-async def save_upload_file(upload_file: UploadFile, upload_dir: Path) -> str:
-    """Save uploaded file and return the relative path."""
-    if not upload_file.filename:
-        raise HTTPException(status_code=400, detail="No file provided")
+def content_path(digest: str, extension: str) -> str:
+    """Sharded location of a file within the upload directory.
+
+    ``ab/cd/abcd….jpg`` keeps any one directory small no matter how many
+    images are stored.
+    """
+    return f"{digest[:2]}/{digest[2:4]}/{digest}{extension}"
+
 
-    if not is_allowed_file(upload_file.filename):
+def _copy_upload(source: BinaryIO, upload_dir: Path) -> str:
+    """Stream ``source`` into ``upload_dir`` and return its stored path.
+
+    Chunks go to a hidden temp file in the upload directory while their
+    SHA-256 is computed, and the file is renamed to its content address
+    only once the whole upload has been checked, so readers never see a
+    partial image and memory use stays at one chunk. An identical image
+    that is already stored is reused instead of written twice.
+    """
+    source.seek(0)
+    header = source.read(CHUNK_SIZE)
+    extension = detect_image_type(header)
+    if extension is None:
         raise HTTPException(
             status_code=400,
             detail=(
@@ -40,30 +74,56 @@ async def save_upload_file(upload_file: UploadFile, upload_dir: Path) -> str:
             ),
         )
 
-    if not await validate_file_size(upload_file):
-        raise HTTPException(
-            status_code=400,
-            detail=(
-                f"File too large. Maximum size is {MAX_FILE_SIZE // (1024 * 1024)}MB"
-            ),
-        )
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=upload_dir, prefix=".upload-")
+    temp_path = Path(temp_name)
+    try:
+        digest = hashlib.sha256()
+        with os.fdopen(fd, "wb") as f:
+            size = 0
+            chunk = header
+            while chunk:
+                size += len(chunk)
+                if size > MAX_FILE_SIZE:
+                    raise _file_too_large()
+                digest.update(chunk)
+                f.write(chunk)
+                chunk = source.read(CHUNK_SIZE)
+            f.flush()
+            os.fsync(f.fileno())
+
+        stored_path = content_path(digest.hexdigest(), extension)
+        target = upload_dir / stored_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            # Refresh the mtime so garbage collection treats it as new again
+            temp_path.unlink()
+            os.utime(target)
+        else:
+            temp_path.replace(target)
+        return stored_path
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
-    # Generate unique filename
-    file_extension = get_file_extension(upload_file.filename)
-    unique_filename = f"{uuid.uuid4()}{file_extension}"
 
-    # Ensure upload directory exists
-    upload_dir.mkdir(parents=True, exist_ok=True)
+async def save_upload_file(upload_file: UploadFile, upload_dir: Path) -> str:
+    """Save uploaded file and return the relative path.
+
+    The type is taken from the file's magic bytes rather than its name, and
+    the copy runs in a worker thread so large uploads do not block the
+    event loop.
+    """
+    if not upload_file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
 
-    # Save file
-    file_path = upload_dir / unique_filename
     try:
-        contents = await upload_file.read()
-        with file_path.open("wb") as f:
-            f.write(contents)
+        stored_path = await run_in_threadpool(
+            _copy_upload, upload_file.file, upload_dir
+        )
 
         # Return relative path from assets folder
-        return f"assets/upload/{unique_filename}"
+        return f"{UPLOAD_URL_PREFIX}{stored_path}"
     except OSError as err:
         raise HTTPException(
             status_code=500, detail=f"Error saving file: {err!s}"
@@ -78,12 +138,24 @@ def get_upload_directory() -> Path:
     return base_dir / "assets" / "upload"
 
 
+def resolve_upload_path(file_path: str) -> Path | None:
+    """Map a stored ``assets/upload/...`` path to its file on disk.
+
+    Returns None for paths outside the upload directory, such as the
+    bundled ``assets/img`` placeholders.
+    """
+    if not file_path.startswith(UPLOAD_URL_PREFIX):
+        return None
+    upload_dir = get_upload_directory().resolve()
+    full_path = (upload_dir / file_path.removeprefix(UPLOAD_URL_PREFIX)).resolve()
+    return full_path if full_path.is_relative_to(upload_dir) else None
+
+
 def delete_file(file_path: str) -> bool:
     """Delete a file from the upload directory."""
     try:
-        upload_dir = get_upload_directory()
-        full_path = upload_dir / Path(file_path).name
-        if full_path.exists():
+        full_path = resolve_upload_path(file_path)
+        if full_path is not None and full_path.exists():
             full_path.unlink()
             return True
         return False
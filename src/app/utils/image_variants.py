@@ -0,0 +1,200 @@
+"""Resized WebP/AVIF variants of uploaded featured images.
+
+After an upload is saved, ``process_image`` runs ``generate_variants`` in a
+process pool so resizing never competes with request handling. The source
+is decoded once, EXIF orientation is applied, and each width is written
+without metadata. The dimensions and a ``srcset`` per format are stored in
+the ``images`` table, and every program, event and news article using the
+image is touched so cached API responses pick up the variants.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    from PIL import Image as PILImage
+    from PIL import ImageOps
+except ImportError:  # optional dependency
+    PILImage = None
+
+logger = logging.getLogger(__name__)
+
+VARIANT_WIDTHS = tuple(
+    int(w) for w in os.getenv("UYD_IMAGE_WIDTHS", "320,640,1024,1600").split(",")
+)
+IMAGE_WORKERS = int(os.getenv("UYD_IMAGE_WORKERS", "2"))
+VARIANT_QUALITY = int(os.getenv("UYD_IMAGE_QUALITY", "80"))
+
+_pool: ProcessPoolExecutor | None = None
+
+# Database and app modules are imported inside the async helpers below, so
+# worker processes, which import this module, only load Pillow.
+
+
+def _output_formats() -> dict[str, tuple[str, str]]:
+    """MIME type -> (Pillow format, extension), best compression first."""
+    PILImage.init()
+    formats = {}
+    if "AVIF" not in PILImage.SAVE:
+        try:
+            import pillow_avif  # noqa: F401  (AVIF plugin for Pillow < 11.2)
+        except ImportError:
+            pass
+    if "AVIF" in PILImage.SAVE:
+        formats["image/avif"] = ("AVIF", ".avif")
+    formats["image/webp"] = ("WEBP", ".webp")
+    return formats
+
+
+def generate_variants(source: str, output_dir: str, url_prefix: str) -> dict:
+    """Write resized copies of ``source`` and describe them.
+
+    Runs in a worker process. Variants are written next to the source as
+    ``<stem>-<width>w.<ext>``. Widths wider than the original are skipped,
+    and the original width is used instead when it is below the largest
+    configured width, so small images still get a re-encoded copy.
+    """
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    stem = Path(source).stem
+
+    with PILImage.open(source) as original:
+        # Bake in the EXIF orientation before the EXIF block is dropped
+        image = ImageOps.exif_transpose(original)
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    width, height = image.size
+    widths = sorted(
+        {w for w in VARIANT_WIDTHS if w < width} | {min(width, max(VARIANT_WIDTHS))}
+    )
+
+    srcset = {}
+    for mime_type, (image_format, extension) in _output_formats().items():
+        entries = []
+        for variant_width in widths:
+            variant_height = max(1, round(height * variant_width / width))
+            resized = (
+                image
+                if variant_width == width
+                else image.resize(
+                    (variant_width, variant_height), PILImage.Resampling.LANCZOS
+                )
+            )
+            name = f"{stem}-{variant_width}w{extension}"
+            # No exif/icc_profile arguments, so no metadata is written
+            resized.save(output / name, image_format, quality=VARIANT_QUALITY)
+            entries.append(f"{url_prefix}/{name} {variant_width}w")
+        srcset[mime_type] = ", ".join(entries)
+
+    return {"width": width, "height": height, "srcset": srcset}
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        # spawn, because forking a process that runs database threads is unsafe
+        _pool = ProcessPoolExecutor(
+            max_workers=IMAGE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pool
+
+
+def shutdown_image_pool() -> None:
+    """Stop the worker processes, waiting for queued images to finish."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True)
+        _pool = None
+
+
+async def process_image(path: str) -> None:
+    """Generate and record variants for an uploaded ``featured_image`` path.
+
+    Meant to run as a background task after the upload response is sent.
+    Does nothing when Pillow is not installed.
+    """
+    if PILImage is None:
+        return
+
+    from sqlalchemy import update
+
+    from src.app.database.config import AsyncSessionLocal
+    from src.app.database.tables import Event, Image, NewsArticle, Program, utcnow
+    from src.app.utils.image_upload import resolve_upload_path
+    from src.app.utils.response_cache import response_cache
+
+    source = resolve_upload_path(path)
+    if source is None:
+        return
+    async with AsyncSessionLocal() as db:
+        # Deduplicated uploads share the variants of the first copy
+        if await db.get(Image, path) is not None:
+            return
+
+    try:
+        info = await asyncio.get_running_loop().run_in_executor(
+            _get_pool(),
+            generate_variants,
+            str(source),
+            str(source.parent),
+            Path(path).parent.as_posix(),
+        )
+    except Exception:
+        logger.exception("Could not generate variants for %s", path)
+        return
+
+    touched = []
+    async with AsyncSessionLocal() as db:
+        await db.merge(Image(path=path, **info))
+        for model, entity in (
+            (Program, "programs"),
+            (Event, "events"),
+            (NewsArticle, "news"),
+        ):
+            result = await db.execute(
+                update(model)
+                .where(model.featured_image == path)
+                .values(updated_at=utcnow())
+            )
+            if result.rowcount:
+                touched.append(entity)
+        await db.commit()
+    for entity in touched:
+        response_cache.invalidate(entity)
+
+
+async def load_image_variants(db, paths) -> dict[str, dict]:
+    """``featured_image_variants`` values for ``paths``, with one query."""
+    from sqlalchemy import select
+
+    from src.app.database.tables import Image
+
+    paths = {path for path in paths if path}
+    if not paths:
+        return {}
+    return {
+        image.path: {
+            "width": image.width,
+            "height": image.height,
+            "srcset": image.srcset,
+        }
+        for image in await db.scalars(select(Image).where(Image.path.in_(paths)))
+    }
+
+
+async def attach_image_variants(db, rows) -> None:
+    """Set ``featured_image_variants`` on ORM ``rows`` with one query."""
+    variants = await load_image_variants(
+        db, (getattr(row, "featured_image", None) for row in rows)
+    )
+    for row in rows:
+        image = variants.get(getattr(row, "featured_image", None))
+        if image is not None:
+            row.featured_image_variants = image
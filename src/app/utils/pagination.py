@@ -0,0 +1,42 @@
+"""Keyset (cursor) pagination helpers."""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+MAX_PAGE_SIZE = int(os.getenv("UYD_MAX_PAGE_SIZE", "100"))
+
+
+def clamp_limit(limit: int) -> int:
+    """Bound a requested page size to ``1..MAX_PAGE_SIZE``."""
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def encode_cursor(*values: object) -> str:
+    """Encode the sort key of the last row of a page as an opaque token."""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: tuple[type, ...]) -> tuple:
+    """Decode a token from :func:`encode_cursor` into values of ``types``."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError("cursor shape mismatch")
+        return tuple(
+            datetime.fromisoformat(value) if kind is datetime else kind(value)
+            for kind, value in zip(types, payload)
+        )
+    except (ValueError, TypeError) as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from err
@@ -0,0 +1,106 @@
+"""Pre-rendered, precompressed static pages served from memory."""
+
+from __future__ import annotations
+
+import gzip
+import os
+import threading
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from hashlib import sha256
+
+from fastapi import Request, Response
+from jinja2 import Environment
+
+from src.app.utils.http_cache import accepted_encodings, is_not_modified
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+PRERENDER_PAGES = os.getenv("UYD_PRERENDER_PAGES", "1") != "0"
+PAGE_MAX_AGE = int(os.getenv("UYD_PAGE_MAX_AGE", "300"))
+
+# Preferred first when the client accepts several
+_ENCODINGS = ("br", "gzip")
+
+
+@dataclass(frozen=True)
+class PrerenderedPage:
+    """Rendered template bytes in every available content encoding."""
+
+    variants: dict[str, bytes]
+    digest: str
+    uptodate: Callable[[], bool] | None
+
+    def etag(self, encoding: str) -> str:
+        # Each encoding is a distinct representation with its own strong tag
+        suffix = "" if encoding == "identity" else f"-{encoding}"
+        return f'"{self.digest}{suffix}"'
+
+
+class StaticPageCache:
+    """Renders context-free templates once and serves the bytes from memory.
+
+    With Jinja's ``auto_reload`` on, a page is re-rendered the first time it
+    is requested after its template file changes.
+    """
+
+    def __init__(self, env: Environment, max_age: int = PAGE_MAX_AGE):
+        self.env = env
+        self.max_age = max_age
+        self._pages: dict[str, PrerenderedPage] = {}
+        self._lock = threading.Lock()
+
+    def render(self, name: str) -> PrerenderedPage:
+        _, _, uptodate = self.env.loader.get_source(self.env, name)
+        body = self.env.get_template(name).render().encode()
+        variants = {"identity": body, "gzip": gzip.compress(body, compresslevel=9)}
+        if brotli is not None:
+            variants["br"] = brotli.compress(body, quality=11)
+        page = PrerenderedPage(
+            variants=variants,
+            digest=sha256(body).hexdigest()[:32],
+            uptodate=uptodate,
+        )
+        with self._lock:
+            self._pages[name] = page
+        return page
+
+    def warm(self, names: Iterable[str]) -> None:
+        for name in names:
+            self.render(name)
+
+    def get(self, name: str) -> PrerenderedPage:
+        page = self._pages.get(name)
+        if page is None:
+            return self.render(name)
+        if self.env.auto_reload and page.uptodate is not None and not page.uptodate():
+            return self.render(name)
+        return page
+
+    def response(self, request: Request, name: str) -> Response:
+        page = self.get(name)
+        accepted = accepted_encodings(request.headers.get("accept-encoding"))
+        encoding = next(
+            (e for e in _ENCODINGS if e in page.variants and e in accepted),
+            "identity",
+        )
+
+        headers = {
+            "ETag": page.etag(encoding),
+            "Cache-Control": f"public, max-age={self.max_age}",
+            "Vary": "Accept-Encoding",
+        }
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+
+        if is_not_modified(request, headers["ETag"]):
+            headers.pop("Content-Encoding", None)
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=page.variants[encoding],
+            media_type="text/html; charset=utf-8",
+            headers=headers,
+        )
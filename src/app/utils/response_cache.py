@@ -0,0 +1,152 @@
+"""In-process response cache for read endpoints."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+_MAX_ENTRIES = int(os.getenv("UYD_CACHE_MAX_ENTRIES", "512"))
+_TTL_SECONDS = float(os.getenv("UYD_CACHE_TTL_SECONDS", "300"))
+
+# Set while the current request must neither read nor fill the cache
+_bypassed: ContextVar[bool] = ContextVar("response_cache_bypassed", default=False)
+
+
+class ResponseCache:
+    """Bounded LRU cache of serialized responses with TTL and entity tags.
+
+    Each entry is tagged with the entity types it was built from
+    (``"programs"``, ``"events"``, ``"news"``) so a write to one table only
+    drops the entries that depend on it. The cache is per process; the TTL
+    bounds how long another worker can serve a stale entry after a write.
+    """
+
+    def __init__(self, max_entries: int = _MAX_ENTRIES, ttl: float = _TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple, tuple[float, Any, frozenset[str]]] = (
+            OrderedDict()
+        )
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(route: str, **params: Any) -> tuple:
+        """Build a key from the route name and its parsed query parameters.
+
+        Parameters left at ``None`` are dropped and the rest are sorted, so
+        equivalent requests share one entry regardless of parameter order.
+        """
+        return (
+            route,
+            tuple(sorted((k, v) for k, v in params.items() if v is not None)),
+        )
+
+    @contextmanager
+    def bypassed(self) -> Iterator[None]:
+        """Serve every lookup in this context as a miss and store nothing.
+
+        Only the current task and the tasks it starts are affected, so
+        concurrent requests keep using the cache.
+        """
+        token = _bypassed.set(True)
+        try:
+            yield
+        finally:
+            _bypassed.reset(token)
+
+    def get(self, key: tuple) -> Any | None:
+        if _bypassed.get():
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value, _ = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def generation(self, entities: Iterable[str]) -> tuple[int, ...]:
+        """Snapshot of the invalidation counters for ``entities``."""
+        with self._lock:
+            return tuple(self._generations.get(e, 0) for e in entities)
+
+    def set(
+        self,
+        key: tuple,
+        value: Any,
+        entities: Iterable[str],
+        generation: tuple[int, ...] | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Store ``value`` under ``key``.
+
+        Passing the ``generation`` taken before the value was loaded makes the
+        store a no-op if one of the entities was invalidated in the meantime,
+        so a read racing a write cannot re-cache the old rows. ``ttl`` can
+        shorten the default lifetime for values that go stale with time.
+        """
+        if _bypassed.get():
+            return
+        entities = tuple(entities)
+        with self._lock:
+            if generation is not None and generation != tuple(
+                self._generations.get(e, 0) for e in entities
+            ):
+                return
+            lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+            self._entries[key] = (
+                time.monotonic() + lifetime,
+                value,
+                frozenset(entities),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, entity: str) -> None:
+        """Drop every entry built from ``entity``."""
+        with self._lock:
+            self._generations[entity] = self._generations.get(entity, 0) + 1
+            stale = [k for k, (_, _, tags) in self._entries.items() if entity in tags]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+response_cache = ResponseCache()
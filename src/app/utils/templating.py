@@ -0,0 +1,51 @@
+"""Jinja environment for the HTML pages.
+
+Compiled templates are written to a ``FileSystemBytecodeCache`` that every
+worker process shares, so only the first process after a template changes
+pays the compile cost; the others, and every later restart, load the
+bytecode. ``warm_templates`` attaches that cache and loads every template
+at startup instead of on the first request that needs it; until then the
+environment has no cache, so creating it touches nothing on disk.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+# Off by default: templates load once and are never checked for changes on
+# disk again. run.py turns it on for development
+TEMPLATE_AUTO_RELOAD = os.getenv("UYD_TEMPLATE_AUTO_RELOAD", "0") != "0"
+
+# Unset uses Jinja's per-user temporary directory; empty disables the cache
+TEMPLATE_CACHE_DIR = os.getenv("UYD_TEMPLATE_CACHE_DIR")
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    if TEMPLATE_CACHE_DIR is None:
+        return FileSystemBytecodeCache()
+    if not TEMPLATE_CACHE_DIR:
+        return None
+    Path(TEMPLATE_CACHE_DIR).mkdir(parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+
+
+def create_template_env(directory: Path) -> Environment:
+    """Environment configured like Starlette's default."""
+    return Environment(
+        loader=FileSystemLoader(directory),
+        autoescape=True,
+        auto_reload=TEMPLATE_AUTO_RELOAD,
+    )
+
+
+def warm_templates(env: Environment) -> int:
+    """Attach the bytecode cache, then load (compile or read) every template."""
+    if env.bytecode_cache is None:
+        env.bytecode_cache = _bytecode_cache()
+    names = env.list_templates(extensions=["html"])
+    for name in names:
+        env.get_template(name)
+    return len(names)
@@ -0,0 +1,154 @@
+"""Reference counting and garbage collection for the upload store.
+
+Uploads are content-addressed, so one file can back the featured image of
+several programs, events and news articles. A file is only removed once no
+row in any of those tables points at it. Rows are soft-deleted, so an
+inactive row still holds its image and can be restored.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from sqlalchemy import delete, func, select, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.database.tables import Event, Image, NewsArticle, Program
+from src.app.utils.image_upload import (
+    UPLOAD_URL_PREFIX,
+    delete_file,
+    get_upload_directory,
+)
+
+# Files younger than this are never removed, so an upload whose row has not
+# been committed yet, or that was just deduplicated, cannot be collected
+GC_GRACE_SECONDS = float(os.getenv("UYD_UPLOAD_GC_GRACE_SECONDS", "3600"))
+
+_REFERENCING_MODELS = (Program, Event, NewsArticle)
+
+
+@dataclass
+class GarbageReport:
+    files_removed: int = 0
+    bytes_freed: int = 0
+    images_removed: int = 0
+
+
+def _variant_paths(image: Image) -> list[str]:
+    return [
+        entry.strip().split(" ")[0]
+        for srcset in (image.srcset or {}).values()
+        for entry in srcset.split(",")
+    ]
+
+
+def _is_stale(path: Path, min_age: float) -> bool:
+    try:
+        return time.time() - path.stat().st_mtime >= min_age
+    except FileNotFoundError:
+        return False
+
+
+async def reference_count(db: AsyncSession, path: str) -> int:
+    """Number of programs, events and news articles using ``path``."""
+    counts = [
+        select(func.count())
+        .select_from(model)
+        .where(model.featured_image == path)
+        .scalar_subquery()
+        for model in _REFERENCING_MODELS
+    ]
+    return sum((await db.execute(select(*counts))).one())
+
+
+async def release_upload(
+    db: AsyncSession, path: str | None, min_age: float = GC_GRACE_SECONDS
+) -> bool:
+    """Delete ``path`` and its variants if nothing references it any more.
+
+    Call after the commit that stopped using ``path``. Returns True if the
+    file was removed.
+    """
+    if not path or not path.startswith(UPLOAD_URL_PREFIX):
+        return False
+    if await reference_count(db, path):
+        return False
+
+    upload_dir = get_upload_directory()
+    full_path = upload_dir / path.removeprefix(UPLOAD_URL_PREFIX)
+    if not _is_stale(full_path, min_age):
+        return False
+
+    image = await db.get(Image, path)
+    if image is not None:
+        for variant in _variant_paths(image):
+            delete_file(variant)
+        await db.delete(image)
+        await db.commit()
+    return delete_file(path)
+
+
+async def collect_garbage(
+    db: AsyncSession, min_age: float = GC_GRACE_SECONDS, dry_run: bool = False
+) -> GarbageReport:
+    """Remove every upload, variant and ``images`` row nothing refers to.
+
+    Also clears temp files left behind by interrupted uploads and the
+    shard directories that end up empty.
+    """
+    referenced = set(
+        await db.scalars(
+            union(
+                *(
+                    select(model.featured_image).where(
+                        model.featured_image.startswith(UPLOAD_URL_PREFIX)
+                    )
+                    for model in _REFERENCING_MODELS
+                )
+            )
+        )
+    )
+
+    report = GarbageReport()
+    upload_dir = get_upload_directory()
+    keep = set(referenced)
+    unused_images = []
+    for image in await db.scalars(select(Image)):
+        source = upload_dir / image.path.removeprefix(UPLOAD_URL_PREFIX)
+        if image.path in referenced:
+            keep.update(_variant_paths(image))
+        elif not source.exists() or _is_stale(source, min_age):
+            unused_images.append(image.path)
+        else:
+            keep.update(_variant_paths(image))
+
+    if upload_dir.exists():
+        for file in upload_dir.rglob("*"):
+            relative = file.relative_to(upload_dir).as_posix()
+            if not file.is_file() or f"{UPLOAD_URL_PREFIX}{relative}" in keep:
+                continue
+            if not _is_stale(file, min_age):
+                continue
+            report.files_removed += 1
+            report.bytes_freed += file.stat().st_size
+            if not dry_run:
+                file.unlink(missing_ok=True)
+
+        if not dry_run:
+            # Deepest first, so emptied parent shards are removed too
+            for directory in sorted(
+                (d for d in upload_dir.rglob("*") if d.is_dir()),
+                key=lambda d: len(d.parts),
+                reverse=True,
+            ):
+                if not any(directory.iterdir()):
+                    directory.rmdir()
+
+    report.images_removed = len(unused_images)
+    if unused_images and not dry_run:
+        await db.execute(delete(Image).where(Image.path.in_(unused_images)))
+        await db.commit()
+    return report
@@ -115,6 +115,10 @@ class UYDApiClient {
         return this.get('/api/core/stats/');
     }
 
+    async getHomeData() {
+        return this.get('/api/core/home');
+    }
+
     // Programs API methods
     async getPrograms(params = {}) {
         return this.get('/api/programs/', params);
@@ -42,6 +42,23 @@ class UYDDataManager {
         }
     }
 
+    /**
+     * Load everything the homepage shows (stats, featured programs,
+     * upcoming events and latest news) in a single request
+     */
+    async loadHomeData() {
+        const home = await this.getData('homeData', () => window.uydApi.getHomeData());
+
+        if (home) {
+            this.updateStatsElements(home.stats);
+            this.updateProgramsSection(home.featured_programs);
+            this.updateEventsSection(home.upcoming_events);
+            this.updateNewsSection(home.latest_news);
+        }
+
+        return home;
+    }
+
     /**
      * Load site statistics and update UI
      */
@@ -185,7 +202,7 @@ class UYDDataManager {
         col.innerHTML = `
             <div class="event-item">
                 <div class="event-image">
-                    <img src="${event.featured_image || 'assets/img/education/events-3.webp'}" alt="${event.title}" class="img-fluid">
+                    ${this.createPicture(event.featured_image || 'assets/img/education/events-3.webp', event.featured_image_variants, event.title, '(min-width: 992px) 33vw, (min-width: 768px) 50vw, 100vw')}
                     <div class="event-date-overlay">
                         <span class="date">${month}<br>${day}</span>
                     </div>
@@ -221,6 +238,19 @@ class UYDDataManager {
         return col;
     }
 
+    /**
+     * Build a <picture> that lets the browser pick a resized variant
+     */
+    createPicture(src, variants, alt, sizes) {
+        const sources = variants
+            ? Object.entries(variants.srcset)
+                .map(([type, srcset]) => `<source type="${type}" srcset="${srcset}" sizes="${sizes}">`)
+                .join('')
+            : '';
+        const dimensions = variants ? ` width="${variants.width}" height="${variants.height}"` : '';
+        return `<picture>${sources}<img src="${src}" alt="${alt}" class="img-fluid"${dimensions}></picture>`;
+    }
+
     /**
      * Update existing event card
      */
@@ -371,7 +401,8 @@ class UYDDataManager {
 
         const descElement = itemElement.querySelector('.post-description');
         if (descElement) {
-            descElement.textContent = article.excerpt || article.content.substring(0, 150) + '...';
+            // List responses leave out `content` unless it is requested with ?fields=
+            descElement.textContent = article.excerpt || (article.content || '').substring(0, 150) + '...';
         }
 
         const dateElement = itemElement.querySelector('.post-date');
@@ -459,13 +490,8 @@ class UYDDataManager {
      */
     async init() {
         try {
-            // Load all data in parallel
-            await Promise.all([
-                this.loadSiteStats(),
-                this.loadUpcomingEvents(),
-                this.loadLatestNews(),
-                this.loadFeaturedPrograms()
-            ]);
+            // One round trip for all homepage data
+            await this.loadHomeData();
 
             console.log('UYD Data Manager initialized successfully');
         } catch (error) {